@@ -10,13 +10,125 @@ This script will:
 
 It handles ImportError gracefully and prints a short summary at the end.
 """
+import argparse
 import os
 import sys
 import pydoc
 import traceback
-from typing import Set, List, Dict, Tuple
+from collections import defaultdict
+from typing import Set, List, Dict, Tuple, Optional, Iterator
 import ast
+import html
 import importlib.util
+import io
+
+
+# Fixed parts of docs/index.html
+INDEX_HEAD = """<!doctype html>
+<html lang="en">
+<head>
+  <meta charset="utf-8">
+  <meta name="viewport" content="width=device-width, initial-scale=1">
+  <title>Farm Data Analyzer - Documentation Index</title>
+  <style>
+    body { font-family: Segoe UI, Arial, Helvetica, sans-serif; padding: 20px; max-width: 1200px; margin: 0 auto; }
+    h1 { font-size: 2rem; color: #2c3e50; border-bottom: 3px solid #3498db; padding-bottom: 10px; }
+    h2 { font-size: 1.5rem; color: #34495e; margin-top: 30px; }
+    h3 { font-size: 1.2rem; color: #7f8c8d; margin-top: 20px; margin-bottom: 10px; }
+    ul { line-height: 1.8; }
+    li { margin-bottom: 5px; }
+    a { color: #3498db; text-decoration: none; }
+    a:hover { text-decoration: underline; }
+    .skipped { color: #e74c3c; font-style: italic; }
+    .summary { background: #ecf0f1; padding: 15px; border-radius: 5px; margin-bottom: 20px; }
+    .package-section { margin-bottom: 30px; }
+  </style>
+</head>
+<body>
+  <h1>Farm Data Analyzer - Documentation Index</h1>
+"""
+
+INDEX_FOOT = """  <hr>
+  <p><small>Generated by pydoc documentation generator | Author: Lucas Zabeu</small></p>
+</body>
+</html>"""
+
+# Section titles for top-level packages and architectural sub-packages
+PACKAGE_TITLES = {
+    'src': 'Source Code Modules',
+    'tests': 'Test Modules'
+}
+
+SUB_PACKAGE_TITLES = {
+    'business': 'Business Logic Layer',
+    'entities': 'Entity/Data Models',
+    'persistence': 'Data Access Layer',
+    'presentation': 'User Interface Layer'
+}
+
+_IMPORT_ERRORS = frozenset({'ImportError', 'ModuleNotFoundError'})
+
+
+def _catches_import_error(handler: ast.ExceptHandler) -> bool:
+    """Return True if an ``except`` clause handles a failed import."""
+    if handler.type is None:  # bare except
+        return True
+    types = handler.type.elts if isinstance(handler.type, ast.Tuple) else [handler.type]
+    return any(isinstance(t, ast.Name) and t.id in _IMPORT_ERRORS for t in types)
+
+
+def iter_imports(body: List[ast.stmt]) -> Iterator[ast.stmt]:
+    """Yield the import statements of a module body.
+
+    Only module-level statements are visited, descending into ``if`` and
+    ``try`` blocks but not into function or class bodies, which is far
+    cheaper than ast.walk over every node. The body of a ``try`` that
+    catches ImportError is an optional import the module already copes
+    without, so it is skipped.
+    """
+    for n in body:
+        if isinstance(n, (ast.Import, ast.ImportFrom)):
+            yield n
+        elif isinstance(n, ast.If):
+            yield from iter_imports(n.body)
+            yield from iter_imports(n.orelse)
+        elif isinstance(n, ast.Try):
+            if not any(_catches_import_error(handler) for handler in n.handlers):
+                yield from iter_imports(n.body)
+            for handler in n.handlers:
+                yield from iter_imports(handler.body)
+            yield from iter_imports(n.orelse)
+            yield from iter_imports(n.finalbody)
+
+
+def _module_list_item(mod: str, ok: bool) -> str:
+    """Return the index.html list entry for one module."""
+    module_display_name = html.escape(mod.split('.')[-1])  # Just the module name
+    mod_escaped = html.escape(mod)
+    if ok:
+        return (f'      <li>📄 <a href="{html.escape(mod + ".html")}">{module_display_name}</a> '
+                f'<small>({mod_escaped})</small></li>\n')
+    return f'      <li class="skipped">📄 {module_display_name} (skipped) <small>({mod_escaped})</small></li>\n'
+
+
+def _iter_module_files(path: str, prefix: str) -> Iterator[Tuple[str, str]]:
+    """Yield (dotted module name, file path) for every module below ``path``.
+
+    Uses os.scandir so the file/directory checks come from the directory
+    listing itself instead of a separate stat per entry. Hidden entries,
+    __pycache__ folders and __init__.py files (packages, not modules) are
+    skipped.
+    """
+    with os.scandir(path) as entries:
+        for entry in entries:
+            name = entry.name
+            if name.startswith('.'):
+                continue
+            if entry.is_dir(follow_symlinks=False):
+                if name != '__pycache__':
+                    yield from _iter_module_files(entry.path, f"{prefix}.{name}")
+            elif name.endswith('.py') and name != '__init__.py' and entry.is_file():
+                yield f"{prefix}.{name[:-3]}", entry.path
 
 
 def find_modules(packages: List[str], project_root: str) -> Dict[str, str]:
@@ -32,40 +144,20 @@ def find_modules(packages: List[str], project_root: str) -> Dict[str, str]:
             print(f"Skipping missing package path: {pkg_path}")
             continue
 
-        for root, dirs, files in os.walk(pkg_path):
-            # Skip __pycache__ and hidden folders
-            dirs[:] = [d for d in dirs if not (d == '__pycache__' or d.startswith('.'))]
-
-            rel_root = os.path.relpath(root, project_root)
-            # Convert path to dotted prefix, e.g. 'src' or 'src.subpkg'
-            if rel_root == '.':
-                prefix = ''
-            else:
-                prefix = rel_root.replace(os.sep, '.')
-
-            for f in files:
-                if not f.endswith('.py'):
-                    continue
-                if f.startswith('.'):
-                    continue
-
-                # Skip __init__.py files - we only want actual modules, not packages
-                if f == '__init__.py':
-                    continue
-                    
-                base = f[:-3]
-                if prefix:
-                    module_name = f"{prefix}.{base}"
-                else:
-                    module_name = f"{pkg}.{base}"
-
-                modules[module_name] = os.path.join(root, f)
+        # Dotted prefix for the package folder, e.g. 'src' or 'src.subpkg'
+        rel_root = os.path.relpath(pkg_path, project_root)
+        prefix = pkg if rel_root == '.' else rel_root.replace(os.sep, '.')
+        modules.update(_iter_module_files(pkg_path, prefix))
 
     return modules
 
 
-def generate_docs(packages: List[str] = None) -> None:
-    """Generate HTML documentation for all modules under the listed packages."""
+def generate_docs(packages: List[str] = None, output_dir: Optional[str] = None) -> None:
+    """Generate HTML documentation for all modules under the listed packages.
+
+    Pages and index.html are written to ``output_dir``, which defaults to
+    ``docs/`` next to this script.
+    """
     if packages is None:
         packages = ['src', 'tests']
 
@@ -82,7 +174,7 @@ def generate_docs(packages: List[str] = None) -> None:
         print("No modules found to document.")
         return
 
-    docs_dir = os.path.join(project_root, 'docs')
+    docs_dir = os.path.abspath(output_dir) if output_dir else os.path.join(project_root, 'docs')
     os.makedirs(docs_dir, exist_ok=True)
 
     orig_cwd = os.getcwd()
@@ -92,6 +184,14 @@ def generate_docs(packages: List[str] = None) -> None:
         failures = []
         # top-level names that are part of this project and should be treated as available
         local_tops = set(packages) | {m.split('.')[0] for m in modules_map.keys()}
+        # find_spec searches sys.path on every call; most modules import the same
+        # names, so remember the answer for each top-level name
+        missing_cache: Dict[str, bool] = {}
+
+        def is_missing(top: str) -> bool:
+            if top not in missing_cache:
+                missing_cache[top] = importlib.util.find_spec(top) is None
+            return missing_cache[top]
 
         for mod in modules:
             file_path = modules_map.get(mod)
@@ -99,16 +199,17 @@ def generate_docs(packages: List[str] = None) -> None:
             # Quick pre-check: parse imports and ensure third-party imports are available
             missing: List[str] = []
             try:
-                with open(file_path, 'r', encoding='utf-8') as fh:
+                # ast.parse accepts bytes and handles the source encoding itself
+                with open(file_path, 'rb') as fh:
                     node = ast.parse(fh.read(), filename=file_path)
-                for n in ast.walk(node):
+                for n in iter_imports(node.body):
                     if isinstance(n, ast.Import):
                         for alias in n.names:
                             top = alias.name.split('.')[0]
                             # skip standard library and project-local packages
                             if top in local_tops:
                                 continue
-                            if importlib.util.find_spec(top) is None:
+                            if is_missing(top):
                                 missing.append(top)
                     elif isinstance(n, ast.ImportFrom):
                         # If this is a relative import (level > 0) it's local to the package
@@ -119,7 +220,7 @@ def generate_docs(packages: List[str] = None) -> None:
                         top = n.module.split('.')[0]
                         if top in local_tops:
                             continue
-                        if importlib.util.find_spec(top) is None:
+                        if is_missing(top):
                             missing.append(top)
             except Exception:
                 # If parsing fails, just attempt to document and let pydoc report issues
@@ -154,7 +255,7 @@ def generate_docs(packages: List[str] = None) -> None:
     # Build an index.html in docs/ linking to generated module pages
     try:
         index_path = os.path.join(docs_dir, 'index.html')
-        grouped: Dict[str, Dict[str, List[Tuple[str, bool]]]] = {}
+        grouped: Dict[str, Dict[str, List[Tuple[str, bool]]]] = defaultdict(lambda: defaultdict(list))
         success_set = set(successes)
 
         # Group modules by package hierarchy
@@ -175,114 +276,57 @@ def generate_docs(packages: List[str] = None) -> None:
                 sub_package = '.'.join(parts[1:-1])
                 module_name = parts[-1]
             
-            if top_package not in grouped:
-                grouped[top_package] = {}
-            if sub_package not in grouped[top_package]:
-                grouped[top_package][sub_package] = []
-                
             grouped[top_package][sub_package].append((mod, mod in success_set))
 
-        lines = [
-            '<!doctype html>',
-            '<html lang="en">',
-            '<head>',
-            '  <meta charset="utf-8">',
-            '  <meta name="viewport" content="width=device-width, initial-scale=1">',
-            f'  <title>Farm Data Analyzer - Documentation Index</title>',
-            '  <style>',
-            '    body { font-family: Segoe UI, Arial, Helvetica, sans-serif; padding: 20px; max-width: 1200px; margin: 0 auto; }',
-            '    h1 { font-size: 2rem; color: #2c3e50; border-bottom: 3px solid #3498db; padding-bottom: 10px; }',
-            '    h2 { font-size: 1.5rem; color: #34495e; margin-top: 30px; }',
-            '    h3 { font-size: 1.2rem; color: #7f8c8d; margin-top: 20px; margin-bottom: 10px; }',
-            '    ul { line-height: 1.8; }',
-            '    li { margin-bottom: 5px; }',
-            '    a { color: #3498db; text-decoration: none; }',
-            '    a:hover { text-decoration: underline; }',
-            '    .skipped { color: #e74c3c; font-style: italic; }',
-            '    .summary { background: #ecf0f1; padding: 15px; border-radius: 5px; margin-bottom: 20px; }',
-            '    .package-section { margin-bottom: 30px; }',
-            '  </style>',
-            '</head>',
-            '<body>',
-            '  <h1>Farm Data Analyzer - Documentation Index</h1>',
-            '  <div class="summary">',
-            f'    <strong>Documentation Summary:</strong> {len(successes)} modules documented',
-            f'    {f" — {len(failures)} skipped/failed" if failures else ""}',
-            '    <br><strong>Author:</strong> Lucas Zabeu',
-            '  </div>',
-        ]
+        buf = io.StringIO()
+        w = buf.write
+        w(INDEX_HEAD)
+        w('  <div class="summary">\n')
+        w(f'    <strong>Documentation Summary:</strong> {len(successes)} modules documented\n')
+        w(f'    {f" — {len(failures)} skipped/failed" if failures else ""}\n')
+        w('    <br><strong>Author:</strong> Lucas Zabeu\n')
+        w('  </div>\n')
 
         for top_package in sorted(grouped.keys()):
-            lines.append(f'  <div class="package-section">')
-            
+            w('  <div class="package-section">\n')
+
             # Package title with description
-            package_titles = {
-                'src': 'Source Code Modules',
-                'tests': 'Test Modules'
-            }
-            title = package_titles.get(top_package, f'{top_package.title()} Package')
-            lines.append(f'    <h2>📦 {title}</h2>')
-            
+            title = PACKAGE_TITLES.get(top_package, f'{top_package.title()} Package')
+            w(f'    <h2>📦 {html.escape(title)}</h2>\n')
+
             # Group modules by sub-package
             sub_packages = grouped[top_package]
-            
+
             for sub_package in sorted(sub_packages.keys()):
                 modules_in_sub = sub_packages[sub_package]
-                
-                if sub_package == 'main':
-                    # Direct modules in top package
-                    if len(modules_in_sub) > 0:
-                        lines.append('    <ul>')
-                        for mod, ok in sorted(modules_in_sub):
-                            filename = f"{mod}.html"
-                            module_display_name = mod.split('.')[-1]  # Just the module name
-                            if ok:
-                                lines.append(f'      <li>📄 <a href="{filename}">{module_display_name}</a> <small>({mod})</small></li>')
-                            else:
-                                lines.append(f'      <li class="skipped">📄 {module_display_name} (skipped) <small>({mod})</small></li>')
-                        lines.append('    </ul>')
-                else:
-                    # Modules in sub-packages
-                    sub_package_titles = {
-                        'business': 'Business Logic Layer',
-                        'entities': 'Entity/Data Models',
-                        'persistence': 'Data Access Layer',
-                        'presentation': 'User Interface Layer'
-                    }
-                    sub_title = sub_package_titles.get(sub_package, f'{sub_package.title()} Package')
-                    lines.append(f'    <h3>🔹 {sub_title}</h3>')
-                    lines.append('    <ul>')
-                    
-                    for mod, ok in sorted(modules_in_sub):
-                        filename = f"{mod}.html"
-                        module_display_name = mod.split('.')[-1]  # Just the module name
-                        if ok:
-                            lines.append(f'      <li>📄 <a href="{filename}">{module_display_name}</a> <small>({mod})</small></li>')
-                        else:
-                            lines.append(f'      <li class="skipped">📄 {module_display_name} (skipped) <small>({mod})</small></li>')
-                    
-                    lines.append('    </ul>')
-            
-            lines.append('  </div>')
+
+                if sub_package != 'main':
+                    # Modules in sub-packages get a layer heading
+                    sub_title = SUB_PACKAGE_TITLES.get(sub_package, f'{sub_package.title()} Package')
+                    w(f'    <h3>🔹 {html.escape(sub_title)}</h3>\n')
+                elif not modules_in_sub:
+                    continue
+
+                w('    <ul>\n')
+                for mod, ok in sorted(modules_in_sub):
+                    w(_module_list_item(mod, ok))
+                w('    </ul>\n')
+
+            w('  </div>\n')
 
         if failures:
-            lines.append('  <div class="package-section">')
-            lines.append('    <h2>⚠️ Skipped Modules</h2>')
-            lines.append('    <ul>')
+            w('  <div class="package-section">\n')
+            w('    <h2>⚠️ Skipped Modules</h2>\n')
+            w('    <ul>\n')
             for mod, reason in failures:
-                lines.append(f'      <li class="skipped">{mod}: {reason}</li>')
-            lines.append('    </ul>')
-            lines.append('  </div>')
+                w(f'      <li class="skipped">{html.escape(mod)}: {html.escape(reason)}</li>\n')
+            w('    </ul>\n')
+            w('  </div>\n')
 
-        lines.extend([
-            '  <hr>',
-            '  <p><small>Generated by pydoc documentation generator | Author: Lucas Zabeu</small></p>',
-            '</body>', 
-            '</html>'
-        ])
+        w(INDEX_FOOT)
 
         with open(index_path, 'w', encoding='utf-8') as fh:
-            fh.write('\n'.join(lines))
+            fh.write(buf.getvalue())
 
         print(f"Wrote index to {index_path}")
     except Exception:
@@ -290,5 +334,16 @@ def generate_docs(packages: List[str] = None) -> None:
         traceback.print_exc()
 
 
+def parse_args(argv: Optional[List[str]] = None) -> argparse.Namespace:
+    """Parse command-line options for the documentation generator."""
+    parser = argparse.ArgumentParser(description="Generate pydoc HTML for the project's packages.")
+    parser.add_argument('--packages', nargs='+', default=['src', 'tests'],
+                        help='package folders to document (default: src tests)')
+    parser.add_argument('--output', default=None,
+                        help='directory for the generated HTML (default: docs/)')
+    return parser.parse_args(argv)
+
+
 if __name__ == '__main__':
-    generate_docs()
\ No newline at end of file
+    args = parse_args()
+    generate_docs(args.packages, output_dir=args.output)
\ No newline at end of file
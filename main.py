@@ -8,11 +8,13 @@ Demonstrates the layered architecture with Presentation, Business, and Persisten
 Author: Lucas Zabeu
 """
 
-import sys
 import os
+import sys
 
-# Add the src directory to the Python path for imports
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'src'))
+# Make the project root importable regardless of the working directory
+ROOT = os.path.dirname(os.path.abspath(__file__))
+if ROOT not in sys.path:
+    sys.path.insert(0, ROOT)
 
 from src.presentation.farm_data_ui import FarmDataUI
 
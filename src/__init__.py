@@ -10,9 +10,28 @@ This package implements a three-layered architecture:
 Author: Lucas Zabeu
 """
 
-from .presentation import FarmDataUI
-from .business import FarmDataService
-from .persistence import FarmDataRepository
-from .entities import FarmDataRecord
+import importlib
 
-__all__ = ['FarmDataUI', 'FarmDataService', 'FarmDataRepository', 'FarmDataRecord']
\ No newline at end of file
+__all__ = ['FarmDataUI', 'FarmDataService', 'FarmDataRepository', 'FarmDataRecord']
+
+# Public names and the subpackage providing each one. They are imported on
+# first access (PEP 562) so that importing a single layer, e.g.
+# src.entities, does not pull in pandas and rich through the other layers.
+_LAZY_IMPORTS = {
+    'FarmDataUI': '.presentation',
+    'FarmDataService': '.business',
+    'FarmDataRepository': '.persistence',
+    'FarmDataRecord': '.entities',
+}
+
+
+def __getattr__(name):
+    if name in _LAZY_IMPORTS:
+        value = getattr(importlib.import_module(_LAZY_IMPORTS[name], __name__), name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
\ No newline at end of file
@@ -1,7 +1,28 @@
 """
 Business package for application logic and in-memory data management.
 """
-from .farm_data_service import FarmDataService
-from .search_engine import SearchEngine, SearchCondition, ComparisonOperator, BooleanOperator
+import importlib
 
-__all__ = ['FarmDataService', 'SearchEngine', 'SearchCondition', 'ComparisonOperator', 'BooleanOperator']
\ No newline at end of file
+__all__ = ['FarmDataService', 'SearchEngine', 'SearchCondition', 'ComparisonOperator', 'BooleanOperator']
+
+# Public names and the module providing each one, imported on first access
+# (PEP 562) so that using FarmDataService does not import pandas.
+_LAZY_IMPORTS = {
+    'FarmDataService': '.farm_data_service',
+    'SearchEngine': '.search_engine',
+    'SearchCondition': '.search_engine',
+    'ComparisonOperator': '.search_engine',
+    'BooleanOperator': '.search_engine',
+}
+
+
+def __getattr__(name):
+    if name in _LAZY_IMPORTS:
+        value = getattr(importlib.import_module(_LAZY_IMPORTS[name], __name__), name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
\ No newline at end of file
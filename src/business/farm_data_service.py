@@ -10,7 +10,8 @@ Classes:
 Author: Lucas Zabeu
 """
 
-from typing import List, Optional, Callable
+import heapq
+from typing import List, Optional, Callable, Dict, Tuple
 from operator import attrgetter
 from ..entities.farm_data_record import FarmDataRecord
 from ..persistence.farm_data_repository import FarmDataRepository
@@ -24,11 +25,26 @@ class FarmDataService:
     for CRUD operations on farm data records.
     """
     
+    # Valid sortable fields
+    SORTABLE_FIELDS = frozenset({
+        'ref_date', 'geo', 'area_production_farm_value',
+        'value', 'uom', 'vector', 'coordinate'
+    })
+    
+    # Fields matched by search_records
+    SEARCH_FIELDS = ('geo', 'ref_date', 'area_production_farm_value', 'value')
+    
     def __init__(self):
         """Initialize the service with an empty data structure and repository."""
         self._farm_records: List[FarmDataRecord] = []
         self._repository = FarmDataRepository()
         self._source_filename: Optional[str] = None
+        self._records_view: Optional[Tuple[FarmDataRecord, ...]] = None
+        self._columns: Optional[Dict[str, List[str]]] = None
+        self._numeric_columns: Dict[str, List[float]] = {}
+        self._search_index: Optional[List[Tuple[str, List[int]]]] = None
+        # FarmDataRecord.edit_count() when the cached views were last valid
+        self._seen_edit_count = FarmDataRecord.edit_count()
     
     @property
     def record_count(self) -> int:
@@ -40,6 +56,33 @@ class FarmDataService:
         """Get the filename of the currently loaded dataset."""
         return self._source_filename
     
+    def invalidate_caches(self) -> None:
+        """
+        Discard derived views of the records (search index, column views,
+        parsed numbers) so they are rebuilt from the current records.
+        
+        Loading, adding, updating, deleting and sorting through this service
+        do this automatically, and so does assigning a field of a record in
+        place (see _discard_stale_caches).
+        """
+        self._records_view = None
+        self._columns = None
+        self._numeric_columns = {}
+        self._search_index = None
+        self._seen_edit_count = FarmDataRecord.edit_count()
+    
+    def _discard_stale_caches(self) -> None:
+        """
+        Invalidate the cached views if any record was edited in place.
+        
+        Records handed out by this service are the live objects, so a caller
+        may assign e.g. ``record.geo = "Alberta"``. FarmDataRecord counts such
+        assignments; every view derived from field values checks the count
+        before use and is rebuilt once it has moved on.
+        """
+        if FarmDataRecord.edit_count() != self._seen_edit_count:
+            self.invalidate_caches()
+    
     def load_data_from_file(self, csv_filename: str, max_records: int = 100) -> bool:
         """
         Load farm data from a CSV file into memory.
@@ -55,6 +98,7 @@ class FarmDataService:
             records = self._repository.load_records_from_csv(csv_filename, max_records)
             self._farm_records = records
             self._source_filename = csv_filename
+            self.invalidate_caches()
             return True
         except Exception as e:
             print(f"Failed to load data: {e}")
@@ -76,19 +120,75 @@ class FarmDataService:
             print(f"Failed to save data: {e}")
             return False
     
-    def get_all_records(self) -> List[FarmDataRecord]:
+    def get_all_records(self) -> Tuple[FarmDataRecord, ...]:
         """
         Get all records currently in memory.
         
+        The records are returned as an immutable snapshot that is built once
+        and shared by every caller until the records are loaded, added,
+        updated, deleted or sorted, so repeated calls do not copy the list.
+        The snapshot holds the live records, so edits made to their fields
+        show through it.
+        
         Returns:
-            List of all FarmDataRecord objects in memory.
+            Tuple of all FarmDataRecord objects in memory.
         """
-        return self._farm_records.copy()
+        if self._records_view is None:
+            self._records_view = tuple(self._farm_records)
+        return self._records_view
+    
+    def get_columns(self) -> Dict[str, List[str]]:
+        """
+        Get the in-memory records as a column-oriented view.
+        
+        Each record field (see FarmDataRecord.FIELD_NAMES) maps to a list holding
+        that field's value for every record, in record order. The view is built
+        once and reused until the records are loaded, added, updated, deleted,
+        sorted or edited in place, so callers should treat it as read-only.
+        
+        Returns:
+            Dictionary mapping field names to lists of values.
+        """
+        self._discard_stale_caches()
+        if self._columns is None:
+            fields = FarmDataRecord.FIELD_NAMES
+            if self._farm_records:
+                rows = map(attrgetter(*fields), self._farm_records)
+                self._columns = {field: list(values) for field, values in zip(fields, zip(*rows))}
+            else:
+                self._columns = {field: [] for field in fields}
+        return self._columns
+    
+    def _numeric_column(self, field: str) -> List[float]:
+        """
+        Get a field's values converted to floats, in record order.
+        
+        Each value is parsed once with _safe_numeric_convert and the list is
+        cached alongside the column view, so repeated sorts and top-N queries
+        compare floats instead of re-parsing strings. Like the other views it
+        is rebuilt after the records change or are edited in place.
+        
+        Args:
+            field: Field name from FarmDataRecord.FIELD_NAMES.
+            
+        Returns:
+            List of float values (0.0 for blank or non-numeric entries).
+        """
+        self._discard_stale_caches()
+        column = self._numeric_columns.get(field)
+        if column is None:
+            column = list(map(self._safe_numeric_convert,
+                              map(attrgetter(field), self._farm_records)))
+            self._numeric_columns[field] = column
+        return column
     
     def get_record_by_index(self, index: int) -> Optional[FarmDataRecord]:
         """
         Get a specific record by its index.
         
+        The record itself is returned, not a copy; edits made to its fields
+        are seen by later searches, sorts and rankings.
+        
         Args:
             index: Zero-based index of the record to retrieve.
             
@@ -110,6 +210,7 @@ class FarmDataService:
             True if the record was added successfully.
         """
         self._farm_records.append(record)
+        self.invalidate_caches()
         return True
     
     def update_record(self, index: int, record: FarmDataRecord) -> bool:
@@ -125,6 +226,7 @@ class FarmDataService:
         """
         if 0 <= index < len(self._farm_records):
             self._farm_records[index] = record
+            self.invalidate_caches()
             return True
         return False
     
@@ -140,6 +242,7 @@ class FarmDataService:
         """
         if 0 <= index < len(self._farm_records):
             del self._farm_records[index]
+            self.invalidate_caches()
             return True
         return False
     
@@ -153,18 +256,45 @@ class FarmDataService:
         Returns:
             List of tuples containing (index, record) for matching records.
         """
-        results = []
         search_term_lower = search_term.lower()
+        matches = set()
         
-        for index, record in enumerate(self._farm_records):
-            # Search in key fields
-            if (search_term_lower in record.geo.lower() or
-                search_term_lower in record.ref_date.lower() or
-                search_term_lower in record.area_production_farm_value.lower() or
-                search_term_lower in record.value.lower()):
-                results.append((index, record))
-                
-        return results
+        # Test each distinct field value once and collect the rows holding it
+        for value_lower, indices in self._get_search_index():
+            if search_term_lower in value_lower:
+                matches.update(indices)
+        
+        records = self._farm_records
+        return [(index, records[index]) for index in sorted(matches)]
+    
+    def _get_search_index(self) -> List[Tuple[str, List[int]]]:
+        """
+        Get the inverted index used by search_records.
+        
+        Most searched fields repeat a handful of values (11 locations, a few
+        measurement types, one year per row group), so each distinct value is
+        lowercased once and mapped to the indices of the records holding it.
+        A search then tests every distinct value instead of every record. The
+        index is built on first use and discarded whenever the records change
+        or are edited in place.
+        
+        Returns:
+            List of (lowercased value, record indices) pairs over SEARCH_FIELDS.
+        """
+        self._discard_stale_caches()
+        if self._search_index is None:
+            index = []
+            for field in self.SEARCH_FIELDS:
+                postings: Dict[str, List[int]] = {}
+                for position, value in enumerate(map(attrgetter(field), self._farm_records)):
+                    indices = postings.get(value)
+                    if indices is None:
+                        postings[value] = [position]
+                    else:
+                        indices.append(position)
+                index.extend((value.lower(), indices) for value, indices in postings.items())
+            self._search_index = index
+        return self._search_index
     
     def get_records_by_range(self, start_index: int, end_index: int) -> List[tuple[int, FarmDataRecord]]:
         """
@@ -177,15 +307,11 @@ class FarmDataService:
         Returns:
             List of tuples containing (index, record) for records in the range.
         """
-        results = []
         start = max(0, start_index)
-        end = min(len(self._farm_records) - 1, end_index)
+        stop = max(start, end_index + 1)  # A negative stop would count from the end
         
-        for index in range(start, end + 1):
-            if index < len(self._farm_records):
-                results.append((index, self._farm_records[index]))
-                
-        return results
+        # Slicing bounds the walk to the requested window; no per-index checks
+        return list(enumerate(self._farm_records[start:stop], start))
     
     def sort_records(self, sort_by: str, ascending: bool = True) -> bool:
         """
@@ -214,50 +340,41 @@ class FarmDataService:
             - Maintains stable sort with secondary key (ref_date) for deterministic results
             - Modifies the in-memory list in-place for efficiency
         """
-        # Define valid sortable fields
-        valid_fields = {
-            'ref_date', 'geo', 'area_production_farm_value', 
-            'value', 'uom', 'vector', 'coordinate'
-        }
-        
-        if sort_by not in valid_fields:
+        if sort_by not in self.SORTABLE_FIELDS:
             return False
         
+        reordered: Dict[str, List[float]] = {}
+        
         try:
             # Special handling for numeric fields
-            if sort_by == 'value':
+            if sort_by in ('value', 'coordinate'):
                 # Sort by numeric value with fallback for non-numeric entries
-                # Secondary sort by ref_date for stable, deterministic results
-                self._farm_records = sorted(
-                    self._farm_records,
-                    key=lambda record: (
-                        self._safe_numeric_convert(record.value),
-                        record.ref_date
-                    ),
-                    reverse=not ascending
-                )
-            elif sort_by == 'coordinate':
-                # Sort by coordinate (also numeric)
-                self._farm_records = sorted(
-                    self._farm_records,
-                    key=lambda record: (
-                        self._safe_numeric_convert(record.coordinate),
-                        record.ref_date
-                    ),
-                    reverse=not ascending
-                )
+                # Secondary sort by ref_date for stable, deterministic results.
+                # Keys come from the pre-parsed float column, so each value is
+                # converted at most once.
+                records = self._farm_records
+                values = self._numeric_column(sort_by)
+                keys = list(zip(values, map(attrgetter('ref_date'), records)))
+                order = sorted(range(len(records)), key=keys.__getitem__, reverse=not ascending)
+                self._farm_records = [records[i] for i in order]
+                # The parsed column is still valid once put in the new order
+                reordered = {sort_by: [values[i] for i in order]}
             else:
                 # Sort by string fields using attrgetter for efficiency
-                # Secondary sort by ref_date for deterministic ties
-                self._farm_records = sorted(
-                    self._farm_records,
+                # Secondary sort by ref_date for deterministic ties.
+                # Sorted in place: all keys are computed before any element
+                # moves, so a failing key leaves the list untouched.
+                get_field = attrgetter(sort_by)
+                self._farm_records.sort(
                     key=lambda record: (
-                        getattr(record, sort_by).lower(),  # Case-insensitive string sort
+                        get_field(record).lower(),  # Case-insensitive string sort
                         record.ref_date
                     ),
                     reverse=not ascending
                 )
             
+            self.invalidate_caches()
+            self._numeric_columns.update(reordered)
             return True
             
         except Exception as e:
@@ -275,9 +392,12 @@ class FarmDataService:
             Float representation of value, or 0.0 if conversion fails
         """
         try:
-            # Remove any whitespace and convert
-            return float(value.strip()) if value.strip() else 0.0
-        except (ValueError, AttributeError):
+            # float() already ignores surrounding whitespace, so only blank
+            # values need a check; this avoids raising for empty cells
+            if not value or value.isspace():
+                return 0.0
+            return float(value)
+        except (ValueError, TypeError, AttributeError):
             # Return 0 for invalid numeric values
             return 0.0
     
@@ -295,26 +415,25 @@ class FarmDataService:
             
         Returns:
             List of top N records
+            
+        Raises:
+            ValueError: If n is negative.
         """
-        # Create a copy to avoid modifying original order
-        temp_records = self._farm_records.copy()
+        if n < 0:
+            raise ValueError("n must not be negative")
+        
+        # Select the N best with a bounded heap instead of sorting every record.
+        # heapq.nsmallest/nlargest give the same (stable) result as sorting and
+        # slicing, and fall back to a plain sort when N covers most of the list.
+        select = heapq.nsmallest if ascending else heapq.nlargest
+        records = self._farm_records
         
-        # Sort the copy
         if sort_by == 'value':
-            temp_records = sorted(
-                temp_records,
-                key=lambda record: self._safe_numeric_convert(record.value),
-                reverse=not ascending
-            )
-        else:
-            temp_records = sorted(
-                temp_records,
-                key=attrgetter(sort_by),
-                reverse=not ascending
-            )
-        
-        # Return top N
-        return temp_records[:min(n, len(temp_records))]
+            # Rank indices by the cached float column rather than re-parsing
+            values = self._numeric_column('value')
+            return [records[i] for i in select(n, range(len(records)), key=values.__getitem__)]
+        
+        return select(n, records, key=attrgetter(sort_by))
     
     def get_unique_values(self, field: str) -> set:
         """
@@ -329,14 +448,16 @@ class FarmDataService:
         Returns:
             Set of unique values for the field
         """
-        unique_values = set()
-        
-        for record in self._farm_records:
-            try:
-                value = getattr(record, field)
-                if value:  # Only add non-empty values
-                    unique_values.add(value)
-            except AttributeError:
-                continue
-                
-        return unique_values
\ No newline at end of file
+        if field not in FarmDataRecord.FIELD_NAMES:
+            return set()
+        
+        # Reuse the column view if it is already built; otherwise read just
+        # this field rather than building all fifteen columns
+        self._discard_stale_caches()
+        if self._columns is not None:
+            values = self._columns[field]
+        else:
+            values = map(attrgetter(field), self._farm_records)
+        
+        # Only add non-empty values
+        return set(filter(None, values))
@@ -12,8 +12,11 @@ Classes:
 Author: Lucas Zabeu
 """
 
+import operator
+import numpy as np
 import pandas as pd
 import re
+from functools import lru_cache
 from typing import List, Optional, Dict, Any, Tuple
 from dataclasses import dataclass
 from enum import Enum
@@ -33,6 +36,49 @@ class ComparisonOperator(Enum):
     ENDSWITH = "endswith"
 
 
+# Vectorized comparison function for each ordering operator
+_ORDERING_COMPARISONS = {
+    ComparisonOperator.GREATER_THAN: operator.gt,
+    ComparisonOperator.LESS_THAN: operator.lt,
+    ComparisonOperator.GREATER_EQUAL: operator.ge,
+    ComparisonOperator.LESS_EQUAL: operator.le,
+}
+
+
+@lru_cache(maxsize=256)
+def _compile_pattern(pattern: str, case_sensitive: bool) -> re.Pattern:
+    """
+    Compile a regex search pattern, reusing earlier compilations.
+    
+    Args:
+        pattern: Regular expression entered by the user
+        case_sensitive: Whether matching should respect case
+        
+    Returns:
+        Compiled pattern
+        
+    Raises:
+        re.error: If the pattern is not a valid regular expression
+    """
+    return re.compile(pattern, 0 if case_sensitive else re.IGNORECASE)
+
+
+# Relative evaluation cost of each operator, cheapest first. AND searches apply
+# cheap exact matches before text scans so the scans see fewer rows.
+_OPERATOR_COST = {
+    ComparisonOperator.EQUALS: 0,
+    ComparisonOperator.NOT_EQUALS: 0,
+    ComparisonOperator.GREATER_THAN: 1,
+    ComparisonOperator.LESS_THAN: 1,
+    ComparisonOperator.GREATER_EQUAL: 1,
+    ComparisonOperator.LESS_EQUAL: 1,
+    ComparisonOperator.STARTSWITH: 2,
+    ComparisonOperator.ENDSWITH: 2,
+    ComparisonOperator.CONTAINS: 3,
+    ComparisonOperator.REGEX: 4,
+}
+
+
 class BooleanOperator(Enum):
     """Enumeration of boolean logic operators."""
     AND = "AND"
@@ -89,16 +135,45 @@ class SearchEngine:
         'decimals': 'DECIMALS'
     }
     
+    # Columns holding only a handful of distinct values, stored as categoricals
+    # so equality tests compare integer codes and text operators scan only the
+    # distinct values
+    CATEGORICAL_COLUMNS = ('GEO', 'UOM', 'SCALAR_FACTOR', 'STATUS', 'SYMBOL')
+    
     def __init__(self, dataframe: pd.DataFrame):
         """
         Initialize search engine with a pandas DataFrame.
         
+        The engine keeps a reference to the DataFrame rather than a copy, so
+        callers should not modify it afterwards. Searches never modify it.
+        Low-cardinality columns (see CATEGORICAL_COLUMNS) are converted to the
+        category dtype in a new DataFrame, leaving the caller's untouched.
+        
+        Rows are tracked internally by position, so cached column views can be
+        matched to any subset of rows even when index labels repeat; results
+        are returned with the caller's original labels.
+        
         Args:
             dataframe: pandas DataFrame containing farm data records
         """
-        self._df = dataframe.copy()
+        categorical = {
+            column: 'category' for column in self.CATEGORICAL_COLUMNS
+            if column in dataframe.columns
+            and not isinstance(dataframe[column].dtype, pd.CategoricalDtype)
+        }
+        df = dataframe.astype(categorical) if categorical else dataframe
+        # Original index labels, kept only when they differ from row positions
+        self._labels: Optional[pd.Index] = None
+        if not df.index.equals(pd.RangeIndex(len(df))):
+            self._labels = df.index
+            df = df.set_axis(pd.RangeIndex(len(df)))
+        self._df = df
         self._last_results: Optional[pd.DataFrame] = None
         self._search_history: List[Tuple[List[SearchCondition], BooleanOperator]] = []
+        # Lowercased text of each column, built on first case-insensitive use
+        self._lower_cache: Dict[str, pd.Series] = {}
+        # Numeric parse of each column, built on first ordering comparison
+        self._numeric_cache: Dict[str, pd.Series] = {}
     
     @classmethod
     def from_records(cls, records: List) -> 'SearchEngine':
@@ -111,27 +186,34 @@ class SearchEngine:
         Returns:
             SearchEngine instance initialized with records
         """
-        data = []
-        for record in records:
-            data.append({
-                'REF_DATE': record.ref_date,
-                'GEO': record.geo,
-                'DGUID': record.dguid,
-                'Area, production and farm value of potatoes': record.area_production_farm_value,
-                'UOM': record.uom,
-                'UOM_ID': record.uom_id,
-                'SCALAR_FACTOR': record.scalar_factor,
-                'SCALAR_ID': record.scalar_id,
-                'VECTOR': record.vector,
-                'COORDINATE': record.coordinate,
-                'VALUE': record.value,
-                'STATUS': record.status,
-                'SYMBOL': record.symbol,
-                'TERMINATED': record.terminated,
-                'DECIMALS': record.decimals
-            })
-        
-        df = pd.DataFrame(data)
+        # Fetch all fields of a record in one attrgetter call; pandas then
+        # splits the tuples into columns in C
+        get_fields = operator.attrgetter(*cls.COLUMN_MAPPING)
+        df = pd.DataFrame(
+            list(map(get_fields, records)),
+            columns=list(cls.COLUMN_MAPPING.values())
+        )
+        return cls(df)
+    
+    @classmethod
+    def from_columns(cls, columns: Dict[str, List]) -> 'SearchEngine':
+        """
+        Create a SearchEngine from column-oriented record data.
+        
+        Each column list becomes a DataFrame column directly, avoiding a
+        per-record conversion step.
+        
+        Args:
+            columns: Dictionary mapping FarmDataRecord field names to lists of
+                values, as returned by FarmDataService.get_columns()
+            
+        Returns:
+            SearchEngine instance initialized with the columns
+        """
+        df = pd.DataFrame({
+            cls.COLUMN_MAPPING[field]: values
+            for field, values in columns.items()
+        })
         return cls(df)
     
     def get_available_columns(self) -> List[str]:
@@ -191,6 +273,134 @@ class SearchEngine:
         
         return value
     
+    def _lowercase_column(self, df: pd.DataFrame, column: str) -> pd.Series:
+        """
+        Get the lowercased text of a column for the rows of a DataFrame.
+        
+        Every frame searched is drawn from the engine's own data, so each
+        column is lowercased once over the full dataset and later searches
+        (including refinements of previous results) just select their rows.
+        
+        Args:
+            df: DataFrame being filtered
+            column: Column name
+            
+        Returns:
+            Series of lowercased strings aligned with df's index
+        """
+        lowered = self._lower_cache.get(column)
+        if lowered is None:
+            column_data = self._df[column]
+            lowered = column_data.astype(str).str.lower()
+            if isinstance(column_data.dtype, pd.CategoricalDtype):
+                # Stay categorical so text operators scan only distinct values
+                lowered = lowered.astype('category')
+            self._lower_cache[column] = lowered
+        
+        return self._align(lowered, df)
+    
+    def _numeric_column(self, df: pd.DataFrame, column: str) -> pd.Series:
+        """
+        Get a column parsed as numbers for the rows of a DataFrame.
+        
+        Like _lowercase_column, the full column is parsed once and reused, so
+        repeated or refined ordering comparisons skip the string parsing.
+        
+        Args:
+            df: DataFrame being filtered
+            column: Column name
+            
+        Returns:
+            Series of floats (NaN where a value is not numeric) aligned with
+            df's index
+        """
+        numbers = self._numeric_cache.get(column)
+        if numbers is None:
+            numbers = pd.to_numeric(self._df[column], errors='coerce')
+            self._numeric_cache[column] = numbers
+        
+        return self._align(numbers, df)
+    
+    @staticmethod
+    def _scans_text(df: pd.DataFrame, condition: SearchCondition) -> bool:
+        """
+        Check whether a condition has to scan the text of every row it tests.
+        
+        Regex conditions always do. Other text operators do when they are
+        case-sensitive on a non-categorical column; case-insensitive ones use
+        the cached lowercased text and categoricals scan only their categories.
+        
+        Args:
+            df: DataFrame being filtered
+            condition: Search condition to check
+            
+        Returns:
+            True if the condition scans each row's text
+        """
+        if condition.column not in df.columns:
+            return False
+        if condition.operator == ComparisonOperator.REGEX:
+            return not isinstance(df[condition.column].dtype, pd.CategoricalDtype)
+        return (
+            condition.operator in (ComparisonOperator.CONTAINS,
+                                   ComparisonOperator.STARTSWITH,
+                                   ComparisonOperator.ENDSWITH)
+            and condition.case_sensitive
+            and not isinstance(df[condition.column].dtype, pd.CategoricalDtype)
+        )
+    
+    @staticmethod
+    def _as_text(column_data: pd.Series) -> pd.Series:
+        """
+        Get a column in a form the .str text operators can be applied to.
+        
+        Categorical columns are returned as they are, so text operators run
+        once per distinct value rather than once per row.
+        
+        Args:
+            column_data: Column to search
+            
+        Returns:
+            The categorical column itself, or the column converted to strings
+        """
+        if isinstance(column_data.dtype, pd.CategoricalDtype):
+            return column_data
+        return column_data.astype(str)
+    
+    @staticmethod
+    def _align(column: pd.Series, df: pd.DataFrame) -> pd.Series:
+        """
+        Select the rows of a full-dataset column that are present in df.
+        
+        Both are indexed by row position within the engine's data, so the
+        lookup never depends on the caller's (possibly repeated) labels.
+        
+        Args:
+            column: Series covering every row of the engine's data
+            df: DataFrame being filtered
+            
+        Returns:
+            The column itself if df holds every row, else its rows for df
+        """
+        if column.index.equals(df.index):
+            return column
+        return column.iloc[df.index.to_numpy()].set_axis(df.index)
+    
+    def _with_labels(self, df: pd.DataFrame) -> pd.DataFrame:
+        """
+        Restore the caller's index labels on rows of the engine's data.
+        
+        Args:
+            df: DataFrame indexed by row position
+            
+        Returns:
+            df itself if the original labels were row positions, else df
+            relabelled with the original labels
+        """
+        if self._labels is None:
+            return df
+        return df.set_axis(self._labels.take(df.index.to_numpy()))
+    
     def _apply_condition(self, df: pd.DataFrame, condition: SearchCondition) -> pd.Series:
         """
         Apply a single search condition to a DataFrame.
@@ -203,7 +413,7 @@ class SearchEngine:
             Boolean Series indicating which rows match the condition
         """
         if condition.column not in df.columns:
-            return pd.Series([False] * len(df), index=df.index)
+            return pd.Series(False, index=df.index)
         
         column_data = df[condition.column]
         value = condition.value
@@ -211,30 +421,28 @@ class SearchEngine:
         # Handle string operations
         if condition.operator == ComparisonOperator.CONTAINS:
             if not condition.case_sensitive:
-                return column_data.astype(str).str.lower().str.contains(
+                return self._lowercase_column(df, condition.column).str.contains(
                     str(value).lower(), regex=False, na=False
                 )
-            return column_data.astype(str).str.contains(str(value), regex=False, na=False)
+            return self._as_text(column_data).str.contains(str(value), regex=False, na=False)
         
         elif condition.operator == ComparisonOperator.REGEX:
             try:
-                return column_data.astype(str).str.contains(
-                    str(value), regex=True, na=False,
-                    case=condition.case_sensitive
-                )
+                pattern = _compile_pattern(str(value), condition.case_sensitive)
+                return self._as_text(column_data).str.contains(pattern, na=False)
             except re.error:
                 # Invalid regex, return no matches
-                return pd.Series([False] * len(df), index=df.index)
+                return pd.Series(False, index=df.index)
         
         elif condition.operator == ComparisonOperator.STARTSWITH:
             if not condition.case_sensitive:
-                return column_data.astype(str).str.lower().str.startswith(str(value).lower())
-            return column_data.astype(str).str.startswith(str(value))
+                return self._lowercase_column(df, condition.column).str.startswith(str(value).lower())
+            return self._as_text(column_data).str.startswith(str(value))
         
         elif condition.operator == ComparisonOperator.ENDSWITH:
             if not condition.case_sensitive:
-                return column_data.astype(str).str.lower().str.endswith(str(value).lower())
-            return column_data.astype(str).str.endswith(str(value))
+                return self._lowercase_column(df, condition.column).str.endswith(str(value).lower())
+            return self._as_text(column_data).str.endswith(str(value))
         
         # Handle comparison operations
         elif condition.operator == ComparisonOperator.EQUALS:
@@ -243,32 +451,16 @@ class SearchEngine:
         elif condition.operator == ComparisonOperator.NOT_EQUALS:
             return column_data != value
         
-        elif condition.operator == ComparisonOperator.GREATER_THAN:
-            # Try numeric comparison
-            try:
-                return pd.to_numeric(column_data, errors='coerce') > float(value)
-            except (ValueError, TypeError):
-                return column_data > value
-        
-        elif condition.operator == ComparisonOperator.LESS_THAN:
-            try:
-                return pd.to_numeric(column_data, errors='coerce') < float(value)
-            except (ValueError, TypeError):
-                return column_data < value
-        
-        elif condition.operator == ComparisonOperator.GREATER_EQUAL:
-            try:
-                return pd.to_numeric(column_data, errors='coerce') >= float(value)
-            except (ValueError, TypeError):
-                return column_data >= value
-        
-        elif condition.operator == ComparisonOperator.LESS_EQUAL:
+        elif condition.operator in _ORDERING_COMPARISONS:
+            compare = _ORDERING_COMPARISONS[condition.operator]
+            # Try numeric comparison over the whole column at once
             try:
-                return pd.to_numeric(column_data, errors='coerce') <= float(value)
+                return compare(self._numeric_column(df, condition.column), float(value))
             except (ValueError, TypeError):
-                return column_data <= value
+                # Categoricals are unordered, so compare their text instead
+                return compare(column_data.astype(str), value)
         
-        return pd.Series([False] * len(df), index=df.index)
+        return pd.Series(False, index=df.index)
     
     def search(
         self,
@@ -287,36 +479,53 @@ class SearchEngine:
         Returns:
             DataFrame containing matching records
         """
-        # Start with full dataset or previous results
+        # Start with full dataset or previous results. Neither is modified:
+        # boolean indexing below always returns a new DataFrame.
         if refine_previous and self._last_results is not None:
-            df = self._last_results.copy()
+            df = self._last_results
         else:
-            df = self._df.copy()
+            df = self._df
         
         if not conditions:
+            # Hand out a copy so the caller cannot modify the engine's data
+            df = df.copy()
             self._last_results = df
-            return df
-        
-        # Apply first condition
-        mask = self._apply_condition(df, conditions[0])
-        
-        # Combine remaining conditions with boolean operator
-        for condition in conditions[1:]:
-            condition_mask = self._apply_condition(df, condition)
+            return self._with_labels(df)
+        
+        if boolean_op == BooleanOperator.AND:
+            # Narrow the rows after each condition so later (more expensive)
+            # conditions only examine rows that are still candidates
+            results = df
+            for condition in sorted(conditions, key=lambda c: _OPERATOR_COST.get(c.operator, 0)):
+                results = results[self._apply_condition(results, condition)]
+                if results.empty:
+                    break
+        else:  # OR
+            # Build the match mask as a plain numpy array, aligned with df
+            mask = self._apply_condition(df, conditions[0]).to_numpy(dtype=bool, copy=True)
             
-            if boolean_op == BooleanOperator.AND:
-                mask = mask & condition_mask
-            else:  # OR
-                mask = mask | condition_mask
-        
-        # Filter DataFrame
-        results = df[mask].copy()
+            for condition in conditions[1:]:
+                if not self._scans_text(df, condition):
+                    # Comparisons and cached lookups cost less over every row
+                    # than selecting the unmatched ones first
+                    mask |= self._apply_condition(df, condition).to_numpy(dtype=bool)
+                    continue
+                
+                # Run text scans only on rows no earlier condition matched
+                unmatched = np.flatnonzero(~mask)
+                if len(unmatched) == 0:
+                    break
+                remaining = df[[condition.column]].iloc[unmatched]
+                mask[unmatched] = self._apply_condition(remaining, condition).to_numpy(dtype=bool)
+            
+            # Filter DataFrame
+            results = df[mask]
         
         # Store results and history
         self._last_results = results
         self._search_history.append((conditions, boolean_op))
         
-        return results
+        return self._with_labels(results)
     
     def get_last_results(self) -> Optional[pd.DataFrame]:
         """
@@ -325,7 +534,20 @@ class SearchEngine:
         Returns:
             DataFrame of last search results, or None if no search performed
         """
-        return self._last_results.copy() if self._last_results is not None else None
+        if self._last_results is None:
+            return None
+        return self._with_labels(self._last_results.copy())
+    
+    def has_last_results(self) -> bool:
+        """
+        Check whether there are results from a previous search to refine.
+        
+        Unlike get_last_results, this does not copy the results.
+        
+        Returns:
+            True if a search has been performed since the last clear
+        """
+        return self._last_results is not None
     
     def clear_results(self) -> None:
         """Clear last search results and history."""
@@ -356,10 +578,12 @@ class SearchEngine:
             stats['numeric_summary'] = df[numeric_cols].describe().to_dict()
         
         # Text column statistics
-        text_cols = df.select_dtypes(include=['object']).columns
+        text_cols = df.select_dtypes(include=['object', 'string', 'category']).columns
+        unique_counts = df[text_cols].nunique().to_dict()
         for col in text_cols:
-            stats[f'{col}_unique_count'] = df[col].nunique()
-            stats[f'{col}_most_common'] = df[col].mode().iloc[0] if len(df[col].mode()) > 0 else None
+            modes = df[col].mode()
+            stats[f'{col}_unique_count'] = unique_counts[col]
+            stats[f'{col}_most_common'] = modes.iloc[0] if len(modes) > 0 else None
         
         return stats
     
@@ -401,7 +625,14 @@ class SearchEngine:
         if column not in df.columns:
             return []
         
-        unique_vals = df[column].dropna().unique()
+        column_data = df[column]
+        if isinstance(column_data.dtype, pd.CategoricalDtype):
+            # Categories are already distinct and sorted, so look up the ones
+            # in use by code (-1 marks a missing value)
+            codes = np.unique(column_data.cat.codes.to_numpy())
+            return column_data.cat.categories.take(codes[codes >= 0]).tolist()
+        
+        unique_vals = column_data.dropna().unique()
         try:
             return sorted(unique_vals)
         except TypeError:
@@ -2,9 +2,9 @@
 farm_data_record.py
 
 This module defines the FarmDataRecord class, which represents a single
-row of farm data from a CSV file. The class provides accessors and mutators
-for each field, allowing for encapsulated data management and easy integration
-with data analysis workflows.
+row of farm data from a CSV file. Each field is a slotted attribute that can
+be read and assigned directly, keeping records compact and cheap to access
+and allowing for easy integration with data analysis workflows.
 
 Classes:
     FarmDataRecord: Represents a single farm data entry with fields for
@@ -15,6 +15,10 @@ Example:
     print(record.ref_date)
     record.value = "1200"
 
+    Every such assignment is counted (see FarmDataRecord.edit_count), so a
+    FarmDataService holding the record rebuilds its cached views before the
+    next search or ranking.
+
 Attributes:
     None
 
@@ -22,17 +26,35 @@ Raises:
     None
 """
 
-from typing import Optional
+
+# Field assignments made to any record after construction
+_edit_count = 0
 
 
 class FarmDataRecord:
     """
     Record object (entity/data-transfer object) representing a single farm data entry.
     
-    This class uses column names from the dataset as attribute names and provides
-    accessors and mutators for each field.
+    This class uses column names from the dataset as attribute names; each
+    field is read and assigned directly as a public attribute.
+    
+    Fields are stored in __slots__ rather than a per-instance __dict__, which
+    keeps each record compact when thousands of them are held in memory and
+    makes every field access a direct slot lookup.
+    
+    Assigning a field after construction also increments edit_count(), which
+    lets holders of data derived from records notice in-place edits.
     """
     
+    # Public field names in dataset column order
+    FIELD_NAMES = (
+        'ref_date', 'geo', 'dguid', 'area_production_farm_value', 'uom',
+        'uom_id', 'scalar_factor', 'scalar_id', 'vector', 'coordinate',
+        'value', 'status', 'symbol', 'terminated', 'decimals'
+    )
+    
+    __slots__ = FIELD_NAMES
+    
     def __init__(self, ref_date: str = "", geo: str = "", dguid: str = "", 
                  area_production_farm_value: str = "", uom: str = "", 
                  uom_id: str = "", scalar_factor: str = "", scalar_id: str = "",
@@ -59,173 +81,41 @@ class FarmDataRecord:
             terminated: Termination flag
             decimals: Number of decimal places
         """
-        self._ref_date = ref_date
-        self._geo = geo
-        self._dguid = dguid
-        self._area_production_farm_value = area_production_farm_value
-        self._uom = uom
-        self._uom_id = uom_id
-        self._scalar_factor = scalar_factor
-        self._scalar_id = scalar_id
-        self._vector = vector
-        self._coordinate = coordinate
-        self._value = value
-        self._status = status
-        self._symbol = symbol
-        self._terminated = terminated
-        self._decimals = decimals
-    
-    # Accessors (getters)
-    @property
-    def ref_date(self) -> str:
-        """Get reference date."""
-        return self._ref_date
-    
-    @property
-    def geo(self) -> str:
-        """Get geographic location."""
-        return self._geo
-    
-    @property
-    def dguid(self) -> str:
-        """Get geographic unique identifier."""
-        return self._dguid
-    
-    @property
-    def area_production_farm_value(self) -> str:
-        """Get area, production and farm value description."""
-        return self._area_production_farm_value
-    
-    @property
-    def uom(self) -> str:
-        """Get unit of measurement."""
-        return self._uom
-    
-    @property
-    def uom_id(self) -> str:
-        """Get unit of measurement ID."""
-        return self._uom_id
-    
-    @property
-    def scalar_factor(self) -> str:
-        """Get scalar factor."""
-        return self._scalar_factor
-    
-    @property
-    def scalar_id(self) -> str:
-        """Get scalar ID."""
-        return self._scalar_id
-    
-    @property
-    def vector(self) -> str:
-        """Get vector identifier."""
-        return self._vector
-    
-    @property
-    def coordinate(self) -> str:
-        """Get coordinate value."""
-        return self._coordinate
-    
-    @property
-    def value(self) -> str:
-        """Get the data value."""
-        return self._value
-    
-    @property
-    def status(self) -> str:
-        """Get data status."""
-        return self._status
-    
-    @property
-    def symbol(self) -> str:
-        """Get symbol indicator."""
-        return self._symbol
-    
-    @property
-    def terminated(self) -> str:
-        """Get termination flag."""
-        return self._terminated
-    
-    @property
-    def decimals(self) -> str:
-        """Get number of decimal places."""
-        return self._decimals
-    
-    # Mutators (setters)
-    @ref_date.setter
-    def ref_date(self, value: str) -> None:
-        """Set reference date."""
-        self._ref_date = value
-    
-    @geo.setter
-    def geo(self, value: str) -> None:
-        """Set geographic location."""
-        self._geo = value
-    
-    @dguid.setter
-    def dguid(self, value: str) -> None:
-        """Set geographic unique identifier."""
-        self._dguid = value
-    
-    @area_production_farm_value.setter
-    def area_production_farm_value(self, value: str) -> None:
-        """Set area, production and farm value description."""
-        self._area_production_farm_value = value
-    
-    @uom.setter
-    def uom(self, value: str) -> None:
-        """Set unit of measurement."""
-        self._uom = value
-    
-    @uom_id.setter
-    def uom_id(self, value: str) -> None:
-        """Set unit of measurement ID."""
-        self._uom_id = value
-    
-    @scalar_factor.setter
-    def scalar_factor(self, value: str) -> None:
-        """Set scalar factor."""
-        self._scalar_factor = value
-    
-    @scalar_id.setter
-    def scalar_id(self, value: str) -> None:
-        """Set scalar ID."""
-        self._scalar_id = value
-    
-    @vector.setter
-    def vector(self, value: str) -> None:
-        """Set vector identifier."""
-        self._vector = value
-    
-    @coordinate.setter
-    def coordinate(self, value: str) -> None:
-        """Set coordinate value."""
-        self._coordinate = value
-    
-    @value.setter
-    def value(self, value: str) -> None:
-        """Set the data value."""
-        self._value = value
-    
-    @status.setter
-    def status(self, value: str) -> None:
-        """Set data status."""
-        self._status = value
-    
-    @symbol.setter
-    def symbol(self, value: str) -> None:
-        """Set symbol indicator."""
-        self._symbol = value
-    
-    @terminated.setter
-    def terminated(self, value: str) -> None:
-        """Set termination flag."""
-        self._terminated = value
+        # Store through the slot descriptors directly: building a record is
+        # not an edit, and this skips the counting __setattr__ below
+        for set_field, field_value in zip(_FIELD_SETTERS, (
+                ref_date, geo, dguid, area_production_farm_value, uom,
+                uom_id, scalar_factor, scalar_id, vector, coordinate,
+                value, status, symbol, terminated, decimals)):
+            set_field(self, field_value)
+    
+    def __setattr__(self, name: str, value) -> None:
+        """
+        Assign a field and count the edit.
+        
+        Args:
+            name: Field name from FIELD_NAMES.
+            value: New value for the field.
+            
+        Raises:
+            AttributeError: If name is not a field of the record.
+        """
+        global _edit_count
+        object.__setattr__(self, name, value)
+        _edit_count += 1
     
-    @decimals.setter
-    def decimals(self, value: str) -> None:
-        """Set number of decimal places."""
-        self._decimals = value
+    @staticmethod
+    def edit_count() -> int:
+        """
+        Get the number of field assignments made to records after construction.
+        
+        The count only ever grows, so comparing it with an earlier reading
+        tells whether any record may have been edited in place since then.
+        
+        Returns:
+            Total number of in-place field assignments across all records.
+        """
+        return _edit_count
     
     def __str__(self) -> str:
         """
@@ -235,12 +125,12 @@ class FarmDataRecord:
             Formatted string showing key information from the record
         """
         return (f"Farm Data Record:\n"
-                f"  Year: {self._ref_date}\n"
-                f"  Location: {self._geo}\n"
-                f"  Type: {self._area_production_farm_value}\n"
-                f"  Value: {self._value} {self._uom}\n"
-                f"  Vector: {self._vector}\n"
-                f"  Coordinate: {self._coordinate}")
+                f"  Year: {self.ref_date}\n"
+                f"  Location: {self.geo}\n"
+                f"  Type: {self.area_production_farm_value}\n"
+                f"  Value: {self.value} {self.uom}\n"
+                f"  Vector: {self.vector}\n"
+                f"  Coordinate: {self.coordinate}")
     
     def to_csv_row(self) -> dict:
         """
@@ -250,19 +140,23 @@ class FarmDataRecord:
             Dictionary with column names as keys and record values as values.
         """
         return {
-            "REF_DATE": self._ref_date,
-            "GEO": self._geo,
-            "DGUID": self._dguid,
-            "Area, production and farm value of potatoes": self._area_production_farm_value,
-            "UOM": self._uom,
-            "UOM_ID": self._uom_id,
-            "SCALAR_FACTOR": self._scalar_factor,
-            "SCALAR_ID": self._scalar_id,
-            "VECTOR": self._vector,
-            "COORDINATE": self._coordinate,
-            "VALUE": self._value,
-            "STATUS": self._status,
-            "SYMBOL": self._symbol,
-            "TERMINATED": self._terminated,
-            "DECIMALS": self._decimals
-        }
\ No newline at end of file
+            "REF_DATE": self.ref_date,
+            "GEO": self.geo,
+            "DGUID": self.dguid,
+            "Area, production and farm value of potatoes": self.area_production_farm_value,
+            "UOM": self.uom,
+            "UOM_ID": self.uom_id,
+            "SCALAR_FACTOR": self.scalar_factor,
+            "SCALAR_ID": self.scalar_id,
+            "VECTOR": self.vector,
+            "COORDINATE": self.coordinate,
+            "VALUE": self.value,
+            "STATUS": self.status,
+            "SYMBOL": self.symbol,
+            "TERMINATED": self.terminated,
+            "DECIMALS": self.decimals
+        }
+
+
+# Slot setters in FIELD_NAMES order, used by FarmDataRecord.__init__
+_FIELD_SETTERS = tuple(getattr(FarmDataRecord, name).__set__ for name in FarmDataRecord.FIELD_NAMES)
@@ -11,8 +11,10 @@ Author: Lucas Zabeu
 """
 
 import csv
-import os
-from typing import List, Optional
+from sys import intern
+from itertools import islice
+from operator import attrgetter, itemgetter
+from typing import Iterator, List, Optional
 from ..entities.farm_data_record import FarmDataRecord
 
 
@@ -43,10 +45,110 @@ class FarmDataRepository:
     TERMINATED = "TERMINATED"
     DECIMALS = "DECIMALS"
     
+    # Column order of the dataset, matching FarmDataRecord's constructor arguments
+    FIELDNAMES = (
+        REF_DATE, GEO, DGUID, AREA_PRODUCTION_FARM_VALUE,
+        UOM, UOM_ID, SCALAR_FACTOR, SCALAR_ID,
+        VECTOR, COORDINATE, VALUE, STATUS,
+        SYMBOL, TERMINATED, DECIMALS
+    )
+    
     def __init__(self):
         """Initialize the repository."""
         pass
     
+    def iter_records_from_csv(self, csv_filename: str) -> Iterator[FarmDataRecord]:
+        """
+        Lazily read farm data records from a CSV file, one row at a time.
+        
+        Only the current row is held in memory and parsing stops as soon as the
+        caller stops iterating (e.g. through itertools.islice), so the rest of
+        the file is never read.
+        
+        Args:
+            csv_filename: Path to the CSV file containing farm data.
+        
+        Yields:
+            FarmDataRecord objects in file order.
+            
+        Raises:
+            FileNotFoundError: If the specified CSV file does not exist.
+            PermissionError: If the program lacks permission to read the file.
+            csv.Error: If there is an error parsing the CSV file.
+        """
+        # Let open() report a missing file instead of checking beforehand,
+        # which would stat the file twice and race with its removal.
+        # newline='' hands line endings to the csv module untranslated, as
+        # it requires for quoted fields containing newlines.
+        try:
+            file = open(csv_filename, 'r', encoding='utf-8-sig', newline='')
+        except FileNotFoundError:
+            raise FileNotFoundError(f"CSV file not found: {csv_filename}") from None
+        
+        # Read the CSV file using the csv API library
+        with file:
+            csv_reader = csv.reader(file)
+            
+            # Resolve each column's position once from the header row so every
+            # data row is unpacked positionally instead of through a dict.
+            # Columns missing from the header point just past the header's
+            # last column, a cell that always holds padding below.
+            header = next(csv_reader, [])
+            header_width = len(header)
+            positions = [header.index(name) if name in header else header_width
+                         for name in self.FIELDNAMES]
+            pick_fields = itemgetter(*positions)
+            row_width = max(positions) + 1
+            has_missing = row_width > header_width
+            padding = [""] * row_width
+            
+            for row in csv_reader:
+                if not row:
+                    continue  # Skip blank lines
+                
+                if len(row) < row_width:
+                    row += padding[len(row):]
+                elif has_missing and len(row) > header_width:
+                    # Drop extra trailing cells so they cannot fill missing columns
+                    row = row[:header_width] + padding[header_width:]
+                
+                # Create a new FarmDataRecord with data from CSV row. Most
+                # columns repeat a handful of strings (GEO, UOM, DGUID, ...), so
+                # interning lets all records share one copy. VALUE is interned
+                # too: skipping it per column costs more than the lookup saves.
+                yield FarmDataRecord(*map(intern, pick_fields(row)))
+    
+    def iter_batches(self, csv_filename: str, batch_size: int = 1000) -> Iterator[List[FarmDataRecord]]:
+        """
+        Read farm data records from a CSV file in fixed-size batches.
+        
+        Lets callers process files of any size while holding at most one batch
+        of records in memory at a time.
+        
+        Args:
+            csv_filename: Path to the CSV file containing farm data.
+            batch_size: Maximum number of records per batch (default: 1000).
+        
+        Yields:
+            Lists of FarmDataRecord objects in file order; only the last one
+            may be shorter than batch_size.
+            
+        Raises:
+            ValueError: If batch_size is not positive.
+            FileNotFoundError: If the specified CSV file does not exist.
+            PermissionError: If the program lacks permission to read the file.
+            csv.Error: If there is an error parsing the CSV file.
+        """
+        if batch_size <= 0:
+            raise ValueError("batch_size must be a positive integer")
+        
+        records = self.iter_records_from_csv(csv_filename)
+        while True:
+            batch = list(islice(records, batch_size))
+            if not batch:
+                return
+            yield batch
+    
     def load_records_from_csv(self, csv_filename: str, max_records: int = 100) -> List[FarmDataRecord]:
         """
         Load farm data records from a CSV file.
@@ -64,48 +166,10 @@ class FarmDataRepository:
             csv.Error: If there is an error parsing the CSV file.
             Exception: For any other unexpected errors during file processing.
         """
-        records = []
-        
         try:
-            # Check if file exists
-            if not os.path.exists(csv_filename):
-                raise FileNotFoundError(f"CSV file not found: {csv_filename}")
+            # Stop reading the file once max_records rows have been parsed
+            records = list(islice(self.iter_records_from_csv(csv_filename), max_records))
             
-            # Open and read the CSV file using the csv API library
-            with open(csv_filename, 'r', encoding='utf-8-sig') as file:
-                csv_reader = csv.DictReader(file)
-                
-                # Variables to track records processed
-                records_processed = 0
-                
-                # Loop through CSV rows and create record objects
-                for row in csv_reader:
-                    if records_processed >= max_records:
-                        break
-                    
-                    # Create a new FarmDataRecord with data from CSV row
-                    farm_record = FarmDataRecord(
-                        ref_date=row.get(self.REF_DATE, ""),
-                        geo=row.get(self.GEO, ""),
-                        dguid=row.get(self.DGUID, ""),
-                        area_production_farm_value=row.get(self.AREA_PRODUCTION_FARM_VALUE, ""),
-                        uom=row.get(self.UOM, ""),
-                        uom_id=row.get(self.UOM_ID, ""),
-                        scalar_factor=row.get(self.SCALAR_FACTOR, ""),
-                        scalar_id=row.get(self.SCALAR_ID, ""),
-                        vector=row.get(self.VECTOR, ""),
-                        coordinate=row.get(self.COORDINATE, ""),
-                        value=row.get(self.VALUE, ""),
-                        status=row.get(self.STATUS, ""),
-                        symbol=row.get(self.SYMBOL, ""),
-                        terminated=row.get(self.TERMINATED, ""),
-                        decimals=row.get(self.DECIMALS, "")
-                    )
-                    
-                    # Store record in the list
-                    records.append(farm_record)
-                    records_processed += 1
-                    
         except FileNotFoundError as e:
             print(f"Error: {e}")
             print("Please ensure the CSV file exists in the correct location.")
@@ -142,20 +206,15 @@ class FarmDataRepository:
                 print("No records to save.")
                 return False
                 
-            # Define fieldnames in the order they appear in the original CSV
-            fieldnames = [
-                self.REF_DATE, self.GEO, self.DGUID, self.AREA_PRODUCTION_FARM_VALUE,
-                self.UOM, self.UOM_ID, self.SCALAR_FACTOR, self.SCALAR_ID,
-                self.VECTOR, self.COORDINATE, self.VALUE, self.STATUS,
-                self.SYMBOL, self.TERMINATED, self.DECIMALS
-            ]
+            # FIELDNAMES and FarmDataRecord.FIELD_NAMES share the dataset's
+            # column order, so each record is written as a plain tuple
+            # without building a dict per row
+            get_fields = attrgetter(*FarmDataRecord.FIELD_NAMES)
             
             with open(csv_filename, 'w', newline='', encoding='utf-8-sig') as file:
-                writer = csv.DictWriter(file, fieldnames=fieldnames)
-                writer.writeheader()
-                
-                for record in records:
-                    writer.writerow(record.to_csv_row())
+                writer = csv.writer(file)
+                writer.writerow(self.FIELDNAMES)
+                writer.writerows(map(get_fields, records))
                     
             return True
             
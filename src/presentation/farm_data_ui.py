@@ -12,12 +12,13 @@ Author: Lucas Zabeu
 
 import os
 import sys
-from typing import Optional
+from itertools import islice
+from operator import attrgetter
+from typing import Optional, Tuple
 from ..business.farm_data_service import FarmDataService
 from ..entities.farm_data_record import FarmDataRecord
 from .search_ui import SearchUI
 
-
 class FarmDataUI:
     """
     User interface controller for the farm data analyzer application.
@@ -29,42 +30,106 @@ class FarmDataUI:
     - Displaying results and data
     """
     
+    # Number of records formatted and written per console write
+    PRINT_CHUNK_SIZE = 64
+    
+    # Dataset loaded on startup and offered as the default by option 1
+    DEFAULT_DATA_FILE = "data/CST8333-Area, production  farm value (32100358).csv"
+    
+    # Prompts for each record field, in FarmDataRecord.FIELD_NAMES order so the
+    # answers can be passed straight to the FarmDataRecord constructor
+    CREATE_PROMPTS = (
+        "Reference Date (e.g., 2024): ", "Geographic Location (e.g., Ontario): ",
+        "Geographic Unique ID: ", "Area/Production/Farm Value Description: ",
+        "Unit of Measurement: ", "UOM ID: ", "Scalar Factor: ", "Scalar ID: ",
+        "Vector: ", "Coordinate: ", "Value: ", "Status: ", "Symbol: ",
+        "Terminated: ", "Decimals: "
+    )
+    EDIT_LABELS = (
+        "Reference Date", "Geographic Location", "Geographic Unique ID",
+        "Area/Production/Farm Value", "Unit of Measurement", "UOM ID",
+        "Scalar Factor", "Scalar ID", "Vector", "Coordinate", "Value",
+        "Status", "Symbol", "Terminated", "Decimals"
+    )
+    
+    # Menu choices of the sort and top-N screens mapped to record field names
+    SORT_FIELDS = {
+        '1': 'ref_date',
+        '2': 'geo',
+        '3': 'area_production_farm_value',
+        '4': 'value',
+        '5': 'uom',
+        '6': 'vector',
+        '7': 'coordinate'
+    }
+    TOP_N_FIELDS = {'1': 'value', '2': 'ref_date', '3': 'geo'}
+    
     def __init__(self):
         """Initialize the UI with a business service."""
         self._service = FarmDataService()
         self._author_name = "Lucas Zabeu"
         self._search_ui = None
+        # Source filename shown in the header and its display name, refreshed
+        # only when a different file is loaded
+        self._header_source: Optional[str] = None
+        self._header_dataset: Optional[str] = None
+        # The menu never changes, so it is formatted once and printed in one call
+        self._main_menu_text = "\n".join([
+            f"\n--- Main Menu (Author: {self._author_name}) ---",
+            "1. Load/Reload data from dataset",
+            "2. Save data to new CSV file",
+            "3. Display single record",
+            "4. Display multiple records",
+            "5. Create new record",
+            "6. Edit existing record",
+            "7. Delete record",
+            "8. Search records",
+            "9. Sort records (Data Structures & Algorithms)",
+            "10. View top N records",
+            "11. Advanced Search (Interactive Multi-Column Filtering)",
+            "12. Exit application",
+            "-" * 50
+        ])
+        # Menu choices map straight to their handlers; '12' (exit) is handled
+        # by run_application itself
+        self._menu_actions = {
+            '1': self.handle_load_data,
+            '2': self.handle_save_data,
+            '3': self.handle_display_single_record,
+            '4': self.handle_display_multiple_records,
+            '5': self.handle_create_record,
+            '6': self.handle_edit_record,
+            '7': self.handle_delete_record,
+            '8': self.handle_search_records,
+            '9': self.handle_sort_records,
+            '10': self.handle_top_n_records,
+            '11': self.handle_advanced_search,
+        }
+        self._valid_choices = frozenset(self._menu_actions) | {'12'}
     
     def display_header(self) -> None:
         """
         Display the application header with author name.
         """
-        print("\n" + "=" * 80)
-        print(f"FARM DATA ANALYZER APPLICATION")
-        print(f"Author: {self._author_name}")
-        if self._service.source_filename:
-            print(f"Dataset: {os.path.basename(self._service.source_filename)}")
-        print(f"Records in memory: {self._service.record_count}")
-        print("=" * 80)
+        lines = ["\n" + "=" * 80,
+                 "FARM DATA ANALYZER APPLICATION",
+                 f"Author: {self._author_name}"]
+        source = self._service.source_filename
+        if source != self._header_source:
+            self._header_source = source
+            self._header_dataset = os.path.basename(source) if source else None
+        if self._header_dataset is not None:
+            lines.append(f"Dataset: {self._header_dataset}")
+        lines.append(f"Records in memory: {self._service.record_count}")
+        lines.append("=" * 80)
+        # One write per redraw instead of one per line
+        print("\n".join(lines))
     
     def display_main_menu(self) -> None:
         """
         Display the main menu options.
         """
-        print(f"\n--- Main Menu (Author: {self._author_name}) ---")
-        print("1. Load/Reload data from dataset")
-        print("2. Save data to new CSV file")
-        print("3. Display single record")
-        print("4. Display multiple records")
-        print("5. Create new record")
-        print("6. Edit existing record")
-        print("7. Delete record")
-        print("8. Search records")
-        print("9. Sort records (Data Structures & Algorithms)")
-        print("10. View top N records")
-        print("11. Advanced Search (Interactive Multi-Column Filtering)")
-        print("12. Exit application")
-        print("-" * 50)
+        print(self._main_menu_text)
     
     def get_user_choice(self) -> str:
         """
@@ -75,7 +140,7 @@ class FarmDataUI:
         """
         while True:
             choice = input(f"Enter your choice (1-12) [{self._author_name}]: ").strip()
-            if choice in ['1', '2', '3', '4', '5', '6', '7', '8', '9', '10', '11', '12']:
+            if choice in self._valid_choices:
                 return choice
             print("Invalid choice. Please enter a number between 1 and 12.")
     
@@ -85,7 +150,7 @@ class FarmDataUI:
         filename = input("Enter CSV filename (or press Enter for default): ").strip()
         
         if not filename:
-            filename = "data/CST8333-Area, production  farm value (32100358).csv"
+            filename = self.DEFAULT_DATA_FILE
         
         print(f"Loading data from: {filename}")
         
@@ -108,7 +173,8 @@ class FarmDataUI:
             print("Filename cannot be empty.")
             return
         
-        if not filename.endswith('.csv'):
+        # Accept any case of the extension so 'data.CSV' is not saved as 'data.CSV.csv'
+        if not filename.lower().endswith('.csv'):
             filename += '.csv'
         
         if self._service.save_data_to_file(filename):
@@ -116,6 +182,50 @@ class FarmDataUI:
         else:
             print("Failed to save data.")
     
+    def _read_int(self, prompt: str, minimum: Optional[int] = None,
+                  maximum: Optional[int] = None) -> Optional[int]:
+        """
+        Prompt for a whole number, reporting input that is invalid.
+        
+        Args:
+            prompt: Text shown to the user.
+            minimum: Smallest accepted number, or None for no lower bound.
+            maximum: Largest accepted number, or None for no upper bound.
+            
+        Returns:
+            The number entered, or None if it was not a number or out of range.
+        """
+        try:
+            number = int(input(prompt))
+        except ValueError:
+            print("Invalid input. Please enter a valid number.")
+            return None
+        
+        if (minimum is not None and number < minimum) or (maximum is not None and number > maximum):
+            print(f"Please enter a number between {minimum} and {maximum}")
+            return None
+        return number
+    
+    def _read_record_index(self, prompt: str) -> Optional[Tuple[int, FarmDataRecord]]:
+        """
+        Prompt for the index of a record in memory.
+        
+        Args:
+            prompt: Text shown to the user.
+            
+        Returns:
+            Tuple of (index, record), or None if the input was not a valid index.
+        """
+        index = self._read_int(prompt)
+        if index is None:
+            return None
+        
+        record = self._service.get_record_by_index(index)
+        if record is None:
+            print(f"Invalid index. Please enter a number between 0 and {self._service.record_count - 1}")
+            return None
+        return index, record
+    
     def handle_display_single_record(self) -> None:
         """Handle displaying a single record by index."""
         print(f"\n--- Display Single Record (by {self._author_name}) ---")
@@ -126,18 +236,14 @@ class FarmDataUI:
         
         print(f"Available records: 0 to {self._service.record_count - 1}")
         
-        try:
-            index = int(input("Enter record index: "))
-            record = self._service.get_record_by_index(index)
-            
-            if record:
-                print(f"\nRecord #{index}:")
-                print("-" * 40)
-                print(record)
-            else:
-                print(f"Invalid index. Please enter a number between 0 and {self._service.record_count - 1}")
-        except ValueError:
-            print("Invalid input. Please enter a valid number.")
+        selected = self._read_record_index("Enter record index: ")
+        if selected is None:
+            return
+        
+        index, record = selected
+        print(f"\nRecord #{index}:")
+        print("-" * 40)
+        print(record)
     
     def handle_display_multiple_records(self) -> None:
         """Handle displaying multiple records with options."""
@@ -163,55 +269,71 @@ class FarmDataUI:
         else:
             print("Invalid choice.")
     
+    @classmethod
+    def _print_records(cls, indexed_records, label: str = "Record #") -> None:
+        """
+        Print numbered records, writing them to the console in chunks.
+        
+        Only PRINT_CHUNK_SIZE formatted records are held at a time, so long
+        listings need neither one write per record nor the whole listing as
+        a single string.
+        
+        Args:
+            indexed_records: Iterable of (number, FarmDataRecord) pairs.
+            label: Text printed before each record's number.
+        """
+        indexed_records = iter(indexed_records)
+        while True:
+            chunk = islice(indexed_records, cls.PRINT_CHUNK_SIZE)
+            text = "".join([f"\n{label}{index}:\n{record}\n" for index, record in chunk])
+            if not text:
+                return
+            print(text, end="")
+    
     def _display_all_records(self) -> None:
         """Display all records in memory."""
         records = self._service.get_all_records()
         print(f"\nDisplaying all {len(records)} records:")
         print("-" * 60)
         
-        for index, record in enumerate(records):
-            print(f"\nRecord #{index}:")
-            print(record)
+        self._print_records(enumerate(records))
     
     def _display_records_by_range(self) -> None:
         """Display records within a specified range."""
-        try:
-            start = int(input(f"Enter start index (0 to {self._service.record_count - 1}): "))
-            end = int(input(f"Enter end index (0 to {self._service.record_count - 1}): "))
-            
-            records = self._service.get_records_by_range(start, end)
+        last_index = self._service.record_count - 1
+        start = self._read_int(f"Enter start index (0 to {last_index}): ")
+        if start is None:
+            return
+        end = self._read_int(f"Enter end index (0 to {last_index}): ")
+        if end is None:
+            return
+        
+        records = self._service.get_records_by_range(start, end)
+        
+        if records:
+            print(f"\nDisplaying records {start} to {end}:")
+            print("-" * 60)
             
-            if records:
-                print(f"\nDisplaying records {start} to {end}:")
-                print("-" * 60)
-                
-                for index, record in records:
-                    print(f"\nRecord #{index}:")
-                    print(record)
-            else:
-                print("No records found in the specified range.")
-        except ValueError:
-            print("Invalid input. Please enter valid numbers.")
+            self._print_records(records)
+        else:
+            print("No records found in the specified range.")
     
     def _display_first_n_records(self) -> None:
         """Display the first N records."""
-        try:
-            n = int(input(f"Enter number of records to display (max {self._service.record_count}): "))
-            
-            if n <= 0:
-                print("Number must be greater than 0.")
-                return
-            
-            records = self._service.get_records_by_range(0, n - 1)
-            
-            print(f"\nDisplaying first {len(records)} records:")
-            print("-" * 60)
-            
-            for index, record in records:
-                print(f"\nRecord #{index}:")
-                print(record)
-        except ValueError:
-            print("Invalid input. Please enter a valid number.")
+        n = self._read_int(f"Enter number of records to display (max {self._service.record_count}): ")
+        if n is None:
+            return
+        
+        if n <= 0:
+            print("Number must be greater than 0.")
+            return
+        
+        records = self._service.get_records_by_range(0, n - 1)
+        
+        print(f"\nDisplaying first {len(records)} records:")
+        print("-" * 60)
+        
+        self._print_records(records)
     
     def handle_create_record(self) -> None:
         """Handle creating a new record."""
@@ -219,39 +341,7 @@ class FarmDataUI:
         
         print("Enter details for the new record:")
         
-        ref_date = input("Reference Date (e.g., 2024): ").strip()
-        geo = input("Geographic Location (e.g., Ontario): ").strip()
-        dguid = input("Geographic Unique ID: ").strip()
-        area_production_farm_value = input("Area/Production/Farm Value Description: ").strip()
-        uom = input("Unit of Measurement: ").strip()
-        uom_id = input("UOM ID: ").strip()
-        scalar_factor = input("Scalar Factor: ").strip()
-        scalar_id = input("Scalar ID: ").strip()
-        vector = input("Vector: ").strip()
-        coordinate = input("Coordinate: ").strip()
-        value = input("Value: ").strip()
-        status = input("Status: ").strip()
-        symbol = input("Symbol: ").strip()
-        terminated = input("Terminated: ").strip()
-        decimals = input("Decimals: ").strip()
-        
-        new_record = FarmDataRecord(
-            ref_date=ref_date,
-            geo=geo,
-            dguid=dguid,
-            area_production_farm_value=area_production_farm_value,
-            uom=uom,
-            uom_id=uom_id,
-            scalar_factor=scalar_factor,
-            scalar_id=scalar_id,
-            vector=vector,
-            coordinate=coordinate,
-            value=value,
-            status=status,
-            symbol=symbol,
-            terminated=terminated,
-            decimals=decimals
-        )
+        new_record = FarmDataRecord(*[input(prompt).strip() for prompt in self.CREATE_PROMPTS])
         
         if self._service.add_record(new_record):
             print(f"Successfully created new record. Total records: {self._service.record_count}")
@@ -268,60 +358,26 @@ class FarmDataUI:
         
         print(f"Available records: 0 to {self._service.record_count - 1}")
         
-        try:
-            index = int(input("Enter record index to edit: "))
-            record = self._service.get_record_by_index(index)
-            
-            if not record:
-                print(f"Invalid index. Please enter a number between 0 and {self._service.record_count - 1}")
-                return
-            
-            print(f"\nCurrent record #{index}:")
-            print(record)
-            print(f"\nEnter new values (press Enter to keep current value):")
-            
-            # Get new values with current values as defaults
-            ref_date = input(f"Reference Date [{record.ref_date}]: ").strip() or record.ref_date
-            geo = input(f"Geographic Location [{record.geo}]: ").strip() or record.geo
-            dguid = input(f"Geographic Unique ID [{record.dguid}]: ").strip() or record.dguid
-            area_production_farm_value = input(f"Area/Production/Farm Value [{record.area_production_farm_value}]: ").strip() or record.area_production_farm_value
-            uom = input(f"Unit of Measurement [{record.uom}]: ").strip() or record.uom
-            uom_id = input(f"UOM ID [{record.uom_id}]: ").strip() or record.uom_id
-            scalar_factor = input(f"Scalar Factor [{record.scalar_factor}]: ").strip() or record.scalar_factor
-            scalar_id = input(f"Scalar ID [{record.scalar_id}]: ").strip() or record.scalar_id
-            vector = input(f"Vector [{record.vector}]: ").strip() or record.vector
-            coordinate = input(f"Coordinate [{record.coordinate}]: ").strip() or record.coordinate
-            value = input(f"Value [{record.value}]: ").strip() or record.value
-            status = input(f"Status [{record.status}]: ").strip() or record.status
-            symbol = input(f"Symbol [{record.symbol}]: ").strip() or record.symbol
-            terminated = input(f"Terminated [{record.terminated}]: ").strip() or record.terminated
-            decimals = input(f"Decimals [{record.decimals}]: ").strip() or record.decimals
-            
-            updated_record = FarmDataRecord(
-                ref_date=ref_date,
-                geo=geo,
-                dguid=dguid,
-                area_production_farm_value=area_production_farm_value,
-                uom=uom,
-                uom_id=uom_id,
-                scalar_factor=scalar_factor,
-                scalar_id=scalar_id,
-                vector=vector,
-                coordinate=coordinate,
-                value=value,
-                status=status,
-                symbol=symbol,
-                terminated=terminated,
-                decimals=decimals
-            )
-            
-            if self._service.update_record(index, updated_record):
-                print(f"Successfully updated record #{index}")
-            else:
-                print("Failed to update record.")
-                
-        except ValueError:
-            print("Invalid input. Please enter a valid number.")
+        selected = self._read_record_index("Enter record index to edit: ")
+        if selected is None:
+            return
+        
+        index, record = selected
+        print(f"\nCurrent record #{index}:")
+        print(record)
+        print(f"\nEnter new values (press Enter to keep current value):")
+        
+        # Get new values with current values as defaults
+        current_values = attrgetter(*FarmDataRecord.FIELD_NAMES)(record)
+        updated_record = FarmDataRecord(*[
+            input(f"{label} [{current}]: ").strip() or current
+            for label, current in zip(self.EDIT_LABELS, current_values)
+        ])
+        
+        if self._service.update_record(index, updated_record):
+            print(f"Successfully updated record #{index}")
+        else:
+            print("Failed to update record.")
     
     def handle_delete_record(self) -> None:
         """Handle deleting a record."""
@@ -333,29 +389,23 @@ class FarmDataUI:
         
         print(f"Available records: 0 to {self._service.record_count - 1}")
         
-        try:
-            index = int(input("Enter record index to delete: "))
-            record = self._service.get_record_by_index(index)
-            
-            if not record:
-                print(f"Invalid index. Please enter a number between 0 and {self._service.record_count - 1}")
-                return
-            
-            print(f"\nRecord to delete #{index}:")
-            print(record)
-            
-            confirm = input("\nAre you sure you want to delete this record? (y/N): ").strip().lower()
-            
-            if confirm == 'y' or confirm == 'yes':
-                if self._service.delete_record(index):
-                    print(f"Successfully deleted record. Total records: {self._service.record_count}")
-                else:
-                    print("Failed to delete record.")
+        selected = self._read_record_index("Enter record index to delete: ")
+        if selected is None:
+            return
+        
+        index, record = selected
+        print(f"\nRecord to delete #{index}:")
+        print(record)
+        
+        confirm = input("\nAre you sure you want to delete this record? (y/N): ").strip().lower()
+        
+        if confirm == 'y' or confirm == 'yes':
+            if self._service.delete_record(index):
+                print(f"Successfully deleted record. Total records: {self._service.record_count}")
             else:
-                print("Delete operation cancelled.")
-                
-        except ValueError:
-            print("Invalid input. Please enter a valid number.")
+                print("Failed to delete record.")
+        else:
+            print("Delete operation cancelled.")
     
     def handle_search_records(self) -> None:
         """Handle searching for records."""
@@ -377,9 +427,7 @@ class FarmDataUI:
             print(f"\nFound {len(results)} matching records:")
             print("-" * 60)
             
-            for index, record in results:
-                print(f"\nRecord #{index}:")
-                print(record)
+            self._print_records(results)
         else:
             print(f"No records found matching '{search_term}'")
     
@@ -404,24 +452,13 @@ class FarmDataUI:
         print("  6. vector            - Vector identifier")
         print("  7. coordinate        - Coordinate value (numeric)")
         
-        # Map user choice to field name
-        field_map = {
-            '1': 'ref_date',
-            '2': 'geo',
-            '3': 'area_production_farm_value',
-            '4': 'value',
-            '5': 'uom',
-            '6': 'vector',
-            '7': 'coordinate'
-        }
-        
         choice = input("\nEnter field number to sort by (1-7): ").strip()
         
-        if choice not in field_map:
+        if choice not in self.SORT_FIELDS:
             print("Invalid choice.")
             return
         
-        sort_field = field_map[choice]
+        sort_field = self.SORT_FIELDS[choice]
         
         # Get sort order
         order = input("Sort order - (A)scending or (D)escending? [A]: ").strip().upper()
@@ -435,13 +472,11 @@ class FarmDataUI:
             
             # Show first few records as confirmation
             show_preview = input("\nDisplay first 5 records to confirm? (y/N): ").strip().lower()
-            if show_preview == 'y' or show_preview == 'yes':
+            if show_preview in ('y', 'yes'):
                 records = self._service.get_records_by_range(0, 4)
                 print("\nFirst 5 records after sorting:")
                 print("-" * 60)
-                for index, record in records:
-                    print(f"\nRecord #{index}:")
-                    print(record)
+                self._print_records(records)
         else:
             print("Failed to sort records. Please try again.")
     
@@ -456,59 +491,58 @@ class FarmDataUI:
         print("\nThis feature provides analytical queries like 'top 10 by farm value'")
         print("without modifying the main data structure order.\n")
         
-        try:
-            n = int(input(f"How many top records to display? (1-{self._service.record_count}): "))
-            
-            if n <= 0 or n > self._service.record_count:
-                print(f"Please enter a number between 1 and {self._service.record_count}")
-                return
-            
-            print("\nSort by:")
-            print("  1. value      - Data value (most common)")
-            print("  2. ref_date   - Reference date")
-            print("  3. geo        - Geographic location")
-            
-            sort_choice = input("Enter choice (1-3) [1]: ").strip() or '1'
-            
-            sort_map = {'1': 'value', '2': 'ref_date', '3': 'geo'}
-            sort_field = sort_map.get(sort_choice, 'value')
-            
-            # For numeric fields, default to descending (top values first)
-            # For text fields, default to ascending
-            default_desc = sort_field == 'value'
-            
-            order = input(f"Sort order - (A)scending or (D)escending? [{'D' if default_desc else 'A'}]: ").strip().upper()
-            
-            if not order:
-                ascending = not default_desc
-            else:
-                ascending = order != 'D'
-            
-            print(f"\nGetting top {n} records sorted by '{sort_field}'...")
-            
-            top_records = self._service.get_top_n_records(n, sort_field, ascending)
+        n = self._read_int(f"How many top records to display? (1-{self._service.record_count}): ",
+                           1, self._service.record_count)
+        if n is None:
+            return
+        
+        print("\nSort by:")
+        print("  1. value      - Data value (most common)")
+        print("  2. ref_date   - Reference date")
+        print("  3. geo        - Geographic location")
+        
+        sort_choice = input("Enter choice (1-3) [1]: ").strip() or '1'
+        
+        sort_field = self.TOP_N_FIELDS.get(sort_choice, 'value')
+        
+        # For numeric fields, default to descending (top values first)
+        # For text fields, default to ascending
+        default_desc = sort_field == 'value'
+        
+        order = input(f"Sort order - (A)scending or (D)escending? [{'D' if default_desc else 'A'}]: ").strip().upper()
+        
+        if not order:
+            ascending = not default_desc
+        else:
+            ascending = order != 'D'
+        
+        print(f"\nGetting top {n} records sorted by '{sort_field}'...")
+        
+        top_records = self._service.get_top_n_records(n, sort_field, ascending)
+        
+        if top_records:
+            print(f"\nTop {len(top_records)} records by {sort_field} ({'ascending' if ascending else 'descending'}):")
+            print("=" * 60)
             
-            if top_records:
-                print(f"\nTop {len(top_records)} records by {sort_field} ({'ascending' if ascending else 'descending'}):")
-                print("=" * 60)
-                
-                for index, record in enumerate(top_records, 1):
-                    print(f"\n#{index}:")
-                    print(record)
-            else:
-                print("No records found.")
-                
-        except ValueError:
-            print("Invalid input. Please enter a valid number.")
+            self._print_records(enumerate(top_records, 1), label="#")
+        else:
+            print("No records found.")
     
     def run_application(self) -> None:
         """
         Main method to run the interactive application.
         """
+        # Importing readline gives input() line editing and a history shared by
+        # all prompts; it is not available on every platform (e.g. Windows)
+        try:
+            import readline  # noqa: F401
+        except ImportError:
+            pass
+        
         print(f"Welcome to the Farm Data Analyzer by {self._author_name}!")
         
         # Try to load default data on startup
-        default_file = "data/CST8333-Area, production  farm value (32100358).csv"
+        default_file = self.DEFAULT_DATA_FILE
         if os.path.exists(default_file):
             print(f"Loading default dataset: {default_file}")
             self._service.load_data_from_file(default_file, max_records=100)
@@ -519,33 +553,13 @@ class FarmDataUI:
             
             choice = self.get_user_choice()
             
-            if choice == '1':
-                self.handle_load_data()
-            elif choice == '2':
-                self.handle_save_data()
-            elif choice == '3':
-                self.handle_display_single_record()
-            elif choice == '4':
-                self.handle_display_multiple_records()
-            elif choice == '5':
-                self.handle_create_record()
-            elif choice == '6':
-                self.handle_edit_record()
-            elif choice == '7':
-                self.handle_delete_record()
-            elif choice == '8':
-                self.handle_search_records()
-            elif choice == '9':
-                self.handle_sort_records()
-            elif choice == '10':
-                self.handle_top_n_records()
-            elif choice == '11':
-                self.handle_advanced_search()
-            elif choice == '12':
+            if choice == '12':
                 print(f"\nThank you for using the Farm Data Analyzer!")
                 print(f"Application completed by {self._author_name}")
                 sys.exit(0)
             
+            self._menu_actions[choice]()
+            
             input(f"\nPress Enter to continue... (Author: {self._author_name})")
     
     def handle_advanced_search(self) -> None:
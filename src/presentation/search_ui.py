@@ -63,8 +63,7 @@ class SearchUI:
             self._console.print("[red]No data loaded. Please load data first.[/red]")
             return False
         
-        records = self._service.get_all_records()
-        self._search_engine = SearchEngine.from_records(records)
+        self._search_engine = SearchEngine.from_columns(self._service.get_columns())
         return True
     
     def display_search_header(self) -> None:
@@ -363,7 +362,7 @@ class SearchUI:
         
         # Ask about search refinement
         refine = False
-        if self._search_engine.get_last_results() is not None:
+        if self._search_engine.has_last_results():
             refine = Confirm.ask(
                 "\n[cyan]Refine previous search results?[/cyan]",
                 default=False,
@@ -15,6 +15,7 @@ Author: Lucas Zabeu
 
 import pytest
 import os
+import pandas as pd
 import tempfile
 from src.entities.farm_data_record import FarmDataRecord
 from src.persistence.farm_data_repository import FarmDataRepository
@@ -66,6 +67,23 @@ class TestFarmDataRecord:
         assert sample_record.geo == "United States"
         assert sample_record.value == "600000"
     
+    def test_edits_are_counted(self, sample_record):
+        """Test that field assignments after construction are counted as edits."""
+        before = FarmDataRecord.edit_count()
+        FarmDataRecord(geo="Ontario", value="1")
+        assert FarmDataRecord.edit_count() == before
+        
+        sample_record.value = "1"
+        assert FarmDataRecord.edit_count() == before + 1
+        assert sample_record.value == "1"
+    
+    def test_fields_are_slots(self, sample_record):
+        """Test that records store only the dataset fields, without a __dict__."""
+        assert FarmDataRecord.__slots__ == FarmDataRecord.FIELD_NAMES
+        assert not hasattr(sample_record, '__dict__')
+        with pytest.raises(AttributeError):
+            sample_record.unknown_field = "x"
+    
     def test_string_representation(self, sample_record):
         """Test string representation."""
         str_repr = str(sample_record)
@@ -126,6 +144,35 @@ class TestFarmDataRepository:
             assert len(records) <= 10
             assert isinstance(records[0], FarmDataRecord)
     
+    def test_iter_records_from_csv(self, repository, csv_filename):
+        """Test lazily reading records one at a time."""
+        if os.path.exists(csv_filename):
+            records = repository.iter_records_from_csv(csv_filename)
+            first = next(records)
+            assert isinstance(first, FarmDataRecord)
+            assert first.ref_date == "1908"
+            assert first.geo == "Canada"
+            records.close()
+    
+    def test_iter_batches(self, repository, csv_filename):
+        """Test reading records in fixed-size batches."""
+        if os.path.exists(csv_filename):
+            batches = repository.iter_batches(csv_filename, batch_size=4)
+            first, second = next(batches), next(batches)
+            assert len(first) == 4 and len(second) == 4
+            assert first[0].ref_date == "1908"
+            batches.close()
+            
+            with pytest.raises(ValueError):
+                next(repository.iter_batches(csv_filename, batch_size=0))
+    
+    def test_loaded_strings_are_shared(self, repository, csv_filename):
+        """Test that repeated column values share a single string object."""
+        if os.path.exists(csv_filename):
+            records = repository.load_records_from_csv(csv_filename, max_records=10)
+            assert records[0].geo == records[1].geo
+            assert records[0].geo is records[1].geo
+    
     def test_load_records_file_not_found(self, repository):
         """Test loading from non-existent file."""
         with pytest.raises(FileNotFoundError):
@@ -151,6 +198,35 @@ class TestFarmDataRepository:
             if os.path.exists(temp_filename):
                 os.unlink(temp_filename)
     
+    def test_multiline_field_round_trip(self, repository):
+        """Test that line breaks inside quoted fields survive save and load."""
+        with tempfile.NamedTemporaryFile(mode='w', suffix='.csv', delete=False) as temp_file:
+            temp_filename = temp_file.name
+        
+        try:
+            record = FarmDataRecord(ref_date="2020", geo="Line one\r\nLine two", value="1")
+            repository.save_records_to_csv([record], temp_filename)
+            loaded = repository.load_records_from_csv(temp_filename)
+            assert loaded[0].geo == "Line one\r\nLine two"
+        finally:
+            if os.path.exists(temp_filename):
+                os.unlink(temp_filename)
+    
+    def test_ragged_rows_with_missing_columns(self, repository):
+        """Test that extra trailing cells never fill columns missing from the header."""
+        with tempfile.NamedTemporaryFile(mode='w', suffix='.csv', delete=False) as temp_file:
+            temp_file.write("REF_DATE,GEO,VALUE\n2020,Ontario,5,EXTRA\n2021,Quebec\n")
+            temp_filename = temp_file.name
+        
+        try:
+            first, second = repository.load_records_from_csv(temp_filename)
+            assert (first.ref_date, first.geo, first.value) == ("2020", "Ontario", "5")
+            assert first.dguid == "" and first.decimals == ""
+            assert (second.geo, second.value, second.dguid) == ("Quebec", "", "")
+        finally:
+            if os.path.exists(temp_filename):
+                os.unlink(temp_filename)
+    
     def test_save_empty_records(self, repository):
         """Test saving empty records list."""
         with tempfile.NamedTemporaryFile(mode='w', suffix='.csv', delete=False) as temp_file:
@@ -258,6 +334,34 @@ class TestFarmDataService:
         invalid_delete = service.delete_record(999)
         assert invalid_delete == False
     
+    def test_search_sees_in_place_edit(self, service, sample_record):
+        """Test that searches see fields edited in place on a live record."""
+        service.add_record(sample_record)
+        assert len(service.search_records("test location")) == 1
+        
+        service.get_record_by_index(0).geo = "Alberta"
+        
+        assert len(service.search_records("alberta")) == 1
+        assert service.search_records("test location") == []
+    
+    def test_numeric_views_see_in_place_edit(self, service):
+        """Test that top-N, sorting and column views see values edited in place."""
+        service.add_record(FarmDataRecord(ref_date="2020", value="20"))
+        service.add_record(FarmDataRecord(ref_date="2021", value="10"))
+        assert service.get_top_n_records(1)[0].value == "20"
+        assert service.get_columns()['value'] == ["20", "10"]
+        
+        service.get_record_by_index(1).value = "99"
+        
+        assert service.get_top_n_records(1)[0].value == "99"
+        assert service.get_columns()['value'] == ["20", "99"]
+        assert service.get_unique_values('value') == {"20", "99"}
+        assert service.get_all_records()[1].value == "99"
+        
+        service.get_record_by_index(0).value = "500"
+        service.sort_records('value', ascending=False)
+        assert [record.value for record in service.get_all_records()] == ["500", "99"]
+    
     def test_search_records(self, service):
         """Test searching records."""
         # Add test records
@@ -273,6 +377,19 @@ class TestFarmDataService:
         results = service.search_records("000")
         assert len(results) == 3  # All have "000" in value
     
+    def test_search_records_after_changes(self, service):
+        """Test that searches reflect records changed after an earlier search."""
+        service.add_record(FarmDataRecord(geo="Canada", value="1000"))
+        service.add_record(FarmDataRecord(geo="Ontario", value="2000"))
+        assert len(service.search_records("ontario")) == 1
+    
+        service.update_record(0, FarmDataRecord(geo="Ontario", value="3000"))
+        results = service.search_records("ontario")
+        assert [index for index, _ in results] == [0, 1]
+    
+        service.delete_record(1)
+        assert service.search_records("2000") == []
+    
     def test_get_records_by_range(self, service):
         """Test getting records by range."""
         # Add test records
@@ -291,6 +408,12 @@ class TestFarmDataService:
         
         assert len(all_records) == 1
         assert all_records[0].geo == "Test Location"
+        
+        # The snapshot is shared until the records change
+        assert service.get_all_records() is all_records
+        service.add_record(FarmDataRecord(geo="Second Location"))
+        assert len(all_records) == 1
+        assert len(service.get_all_records()) == 2
     
     def test_sort_records_by_geo(self, service):
         """Test sorting records by geographic location."""
@@ -346,6 +469,30 @@ class TestFarmDataService:
         assert top_records[1].value == "800"
         assert top_records[2].value == "700"
     
+    def test_get_top_n_records_rejects_negative_n(self, service):
+        """Test that a negative N is rejected rather than silently returning nothing."""
+        service.add_record(FarmDataRecord(value="100"))
+        
+        assert service.get_top_n_records(0) == []
+        with pytest.raises(ValueError):
+            service.get_top_n_records(-1)
+        with pytest.raises(ValueError):
+            service.get_top_n_records(-1, 'geo')
+    
+    def test_numeric_values_refresh_after_changes(self, service):
+        """Test that sorting and top N see values changed after an earlier query."""
+        for i in range(5):
+            service.add_record(FarmDataRecord(geo=f"Location {i}", value=str(i * 100)))
+    
+        assert service.get_top_n_records(1, 'value')[0].value == "400"
+        service.sort_records('value', ascending=True)
+        service.update_record(0, FarmDataRecord(geo="Updated", value="1000"))
+    
+        assert service.get_top_n_records(1, 'value')[0].geo == "Updated"
+        service.sort_records('value', ascending=False)
+        assert service.get_record_by_index(0).geo == "Updated"
+        assert service.get_record_by_index(4).value == "100"
+    
     def test_get_unique_values(self, service):
         """Test getting unique values using set data structure."""
         # Add records with some duplicate locations
@@ -362,6 +509,20 @@ class TestFarmDataService:
         assert "Ontario" in unique_geos
         assert "Quebec" in unique_geos
         assert "Alberta" in unique_geos
+        assert service.get_unique_values('not_a_field') == set()
+    
+    def test_get_columns(self, service):
+        """Test the column-oriented view and its refresh after changes."""
+        service.add_record(FarmDataRecord(geo="Ontario", value="100"))
+        service.add_record(FarmDataRecord(geo="Quebec", value="200"))
+        
+        columns = service.get_columns()
+        assert set(columns) == set(FarmDataRecord.FIELD_NAMES)
+        assert columns['geo'] == ["Ontario", "Quebec"]
+        assert columns['value'] == ["100", "200"]
+        
+        service.delete_record(0)
+        assert service.get_columns()['geo'] == ["Quebec"]
 
 
 class TestFarmDataUI:
@@ -376,6 +537,48 @@ class TestFarmDataUI:
         """Test UI initialization."""
         assert ui._author_name == "Lucas Zabeu"
         assert ui._service.record_count == 0
+    
+    def test_menu_actions(self, ui):
+        """Test that every menu choice except exit dispatches to a handler."""
+        assert ui._valid_choices == frozenset(str(i) for i in range(1, 13))
+        assert set(ui._menu_actions) == ui._valid_choices - {'12'}
+        assert ui._menu_actions['1'] == ui.handle_load_data
+        assert ui._menu_actions['11'] == ui.handle_advanced_search
+    
+    def test_read_int(self, ui, monkeypatch, capsys):
+        """Test reading whole numbers with optional bounds."""
+        answers = iter(["7", "abc", "0", "4"])
+        monkeypatch.setattr('builtins.input', lambda prompt: next(answers))
+        
+        assert ui._read_int("n: ") == 7
+        assert ui._read_int("n: ") is None
+        assert "valid number" in capsys.readouterr().out
+        assert ui._read_int("n: ", 1, 5) is None
+        assert "between 1 and 5" in capsys.readouterr().out
+        assert ui._read_int("n: ", 1, 5) == 4
+    
+    def test_print_records_in_chunks(self, ui, capsys):
+        """Test that listings longer than one chunk print every record in order."""
+        count = FarmDataUI.PRINT_CHUNK_SIZE * 2 + 1
+        records = [FarmDataRecord(ref_date=str(2000 + i)) for i in range(count)]
+        
+        ui._print_records(enumerate(records))
+        
+        output = capsys.readouterr().out
+        assert output == "".join(f"\nRecord #{i}:\n{record}\n" for i, record in enumerate(records))
+    
+    def test_print_records_uses_subclass_chunk_size(self, monkeypatch):
+        """Test that a subclass can change how many records are written per chunk."""
+        class SmallChunkUI(FarmDataUI):
+            PRINT_CHUNK_SIZE = 2
+        
+        writes = []
+        monkeypatch.setattr('builtins.print', lambda text, end="\n": writes.append(text))
+        records = [FarmDataRecord(ref_date=str(2000 + i)) for i in range(5)]
+        
+        SmallChunkUI()._print_records(enumerate(records))
+        
+        assert [text.count("Record #") for text in writes] == [2, 2, 1]
 
 
 # Integration tests
@@ -461,6 +664,26 @@ class TestSearchEngine:
         """Create a SearchEngine instance with sample data."""
         return SearchEngine.from_records(sample_records)
     
+    def test_from_columns(self, sample_records):
+        """Test building the engine from a column-oriented view."""
+        service = FarmDataService()
+        for record in sample_records:
+            service.add_record(record)
+        
+        engine = SearchEngine.from_columns(service.get_columns())
+        expected = SearchEngine.from_records(sample_records)
+        assert engine._df.equals(expected._df)
+    
+    def test_categorical_columns(self, search_engine):
+        """Test that low-cardinality columns are stored as categoricals."""
+        assert isinstance(search_engine._df['GEO'].dtype, pd.CategoricalDtype)
+        
+        results_df = search_engine.search(
+            [SearchCondition('GEO', ComparisonOperator.GREATER_THAN, 'P')]
+        )
+        assert list(results_df['GEO']) == ['Quebec']
+        assert search_engine.get_unique_values('GEO') == ['Quebec']
+    
     def test_get_available_columns(self, search_engine):
         """Test retrieving available column names."""
         columns = list(search_engine._df.columns)
@@ -504,6 +727,46 @@ class TestSearchEngine:
         for _, row in results_df.iterrows():
             assert float(row['VALUE']) <= 1000
     
+    def test_has_last_results(self, search_engine):
+        """Test tracking whether there are results to refine."""
+        assert not search_engine.has_last_results()
+        search_engine.search([SearchCondition('GEO', ComparisonOperator.EQUALS, 'Ontario')])
+        assert search_engine.has_last_results()
+        search_engine.clear_results()
+        assert not search_engine.has_last_results()
+    
+    def test_numeric_comparison_refine(self, search_engine):
+        """Test numeric comparison when refining previous results."""
+        search_engine.search([SearchCondition('REF_DATE', ComparisonOperator.EQUALS, '2021')])
+        results_df = search_engine.search(
+            [SearchCondition('VALUE', ComparisonOperator.LESS_THAN, '1000')],
+            refine_previous=True
+        )
+        assert list(results_df['VALUE']) == ['500']
+    
+    def test_duplicate_index_labels(self):
+        """Test narrowing searches on a DataFrame whose index repeats labels."""
+        df = pd.DataFrame(
+            {'VALUE': ['1', '1', '2'], 'GEO': ['Ontario', 'Quebec', 'Ontario']},
+            index=[0, 0, 1]
+        )
+        engine = SearchEngine(df)
+        
+        results_df = engine.search([
+            SearchCondition('VALUE', ComparisonOperator.EQUALS, '1'),
+            SearchCondition('GEO', ComparisonOperator.CONTAINS, 'ont')
+        ])
+        assert list(results_df.index) == [0]
+        assert list(results_df['GEO']) == ['Ontario']
+        assert list(engine.get_last_results().index) == [0]
+        
+        results_df = engine.search([
+            SearchCondition('GEO', ComparisonOperator.EQUALS, 'Ontario'),
+            SearchCondition('VALUE', ComparisonOperator.GREATER_THAN, '1')
+        ])
+        assert list(results_df.index) == [1]
+        assert list(results_df['VALUE']) == ['2']
+    
     def test_text_contains(self, search_engine):
         """Test text contains operator."""
         condition = SearchCondition(
@@ -540,6 +803,21 @@ class TestSearchEngine:
         for _, row in results_df.iterrows():
             assert row['UOM'].endswith('s')
     
+    def test_case_insensitive_refine(self, search_engine):
+        """Test case-insensitive matching when refining previous results."""
+        search_engine.search([SearchCondition('REF_DATE', ComparisonOperator.EQUALS, '2021')])
+        results_df = search_engine.search(
+            [SearchCondition('GEO', ComparisonOperator.STARTSWITH, 'q')],
+            refine_previous=True
+        )
+        assert list(results_df['GEO']) == ['Quebec']
+    
+        results_df = search_engine.search(
+            [SearchCondition('Area, production and farm value of potatoes',
+                             ComparisonOperator.CONTAINS, 'WHEAT')]
+        )
+        assert len(results_df) == 2
+    
     def test_multiple_conditions_and(self, search_engine):
         """Test multiple conditions with AND logic."""
         conditions = [
@@ -585,6 +863,17 @@ class TestSearchEngine:
         geos = {row['GEO'] for _, row in results_df.iterrows()}
         assert geos == {'Canada', 'Quebec'}
     
+    def test_multiple_conditions_or_text_scans(self, search_engine):
+        """Test OR logic where later conditions scan text."""
+        conditions = [
+            SearchCondition('GEO', ComparisonOperator.EQUALS, 'Canada'),
+            SearchCondition('Area, production and farm value of potatoes',
+                            ComparisonOperator.REGEX, '^(?:Corn|Barley)$'),
+            SearchCondition('VECTOR', ComparisonOperator.ENDSWITH, '4', case_sensitive=True)
+        ]
+        results_df = search_engine.search(conditions, boolean_op=BooleanOperator.OR)
+        assert list(results_df['VECTOR']) == ['v001', 'v002', 'v003', 'v004']
+    
     def test_not_equals(self, search_engine):
         """Test not equals comparison."""
         condition = SearchCondition(
@@ -606,6 +895,13 @@ class TestSearchEngine:
         results_df = search_engine.search([condition])
         assert len(results_df) == 0
     
+    def test_results_are_independent_of_engine_data(self, search_engine):
+        """Test that modifying search results leaves the engine's data intact."""
+        for conditions in ([], [SearchCondition('GEO', ComparisonOperator.EQUALS, 'Ontario')]):
+            results_df = search_engine.search(conditions)
+            results_df['GEO'] = 'Changed'
+            assert 'Changed' not in set(search_engine._df['GEO'])
+
     def test_get_summary_statistics(self, search_engine):
         """Test getting summary statistics."""
         condition = SearchCondition(
@@ -617,6 +913,14 @@ class TestSearchEngine:
         stats = results_df.describe()
         assert len(stats) > 0  # Should have count, mean, std, etc.
     
+    def test_text_column_statistics(self, search_engine):
+        """Test unique counts and most common values of text columns."""
+        stats = search_engine.get_summary_statistics()
+        assert stats['total_records'] == 4
+        assert stats['GEO_unique_count'] == 4
+        assert stats['UOM_unique_count'] == 2
+        assert stats['UOM_most_common'] == 'Bushels'
+    
     def test_export_to_csv(self, search_engine):
         """Test exporting search results to CSV."""
         condition = SearchCondition(